@@ -11,11 +11,11 @@ This module exhaustively verifies alignment between:
 If any of these are misaligned, we risk costly redesign later.
 """
 
+import io
 import json
 import sys
-from dataclasses import dataclass
 from enum import IntEnum
-from typing import Dict, List, Tuple, Final
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Final
 
 # =============================================================================
 # Constants from ra_constants_v2.json that affect HDL
@@ -35,8 +35,7 @@ RA_CONSTANTS_AFFECTING_HDL = {
 # Python Layout (from consent_header.py)
 # =============================================================================
 
-@dataclass
-class PythonByteLayout:
+class PythonByteLayout(NamedTuple):
     """18-byte layout from consent_header.py"""
     # Byte offsets
     OFF_RPP_ADDRESS: int = 0      # 4 bytes
@@ -78,8 +77,7 @@ ENTROPY_BYTE_LAYOUT = {
 # HDL Layout (from spiral_consent.v)
 # =============================================================================
 
-@dataclass
-class HDLBitLayout:
+class HDLBitLayout(NamedTuple):
     """Bit positions from spiral_consent.v (matches Python byte layout)"""
     
     # RPP Address (bytes 0-3) -> bits 143:112
@@ -125,8 +123,7 @@ class HDLBitLayout:
 # HDL Stub Layout (from hdl_simulation.py - "canonical" per Architect)
 # =============================================================================
 
-@dataclass  
-class StubBitLayout:
+class StubBitLayout(NamedTuple):
     """
     Bit positions from the 'canonical' stub.
     
@@ -142,6 +139,74 @@ class StubBitLayout:
     reserved:            Tuple[int, int] = (106, 0)    # 107 bits
 
 
+# Layouts are constant tables; share one instance of each.
+PY: Final = PythonByteLayout()
+HDL: Final = HDLBitLayout()
+STUB: Final = StubBitLayout()
+
+
+# =============================================================================
+# Precomputed Verification Tables
+# =============================================================================
+# All layouts are compile-time constants, so every derived range is
+# computed once at import rather than on each verification run.
+
+def _width(pos: Tuple[int, int]) -> int:
+    """Width in bits of an inclusive [msb:lsb] range."""
+    return pos[0] - pos[1] + 1
+
+
+_PY_RANGES: Final[Dict[str, Tuple[int, int]]] = {
+    "RPP_ADDRESS": PY.byte_to_bit_range(PY.OFF_RPP_ADDRESS, 4),
+    "PACKET_ID": PY.byte_to_bit_range(PY.OFF_PACKET_ID, 4),
+    "ORIGIN_REF": PY.byte_to_bit_range(PY.OFF_ORIGIN_REF, 2),
+    "CONSENT_BYTE": PY.byte_to_bit_range(PY.OFF_CONSENT, 1),
+    "ENTROPY_BYTE": PY.byte_to_bit_range(PY.OFF_ENTROPY, 1),
+    "FALLBACK": PY.byte_to_bit_range(PY.OFF_FALLBACK, 1),
+    "WINDOW_ID": PY.byte_to_bit_range(PY.OFF_WINDOW_ID, 2),
+    "CRC": PY.byte_to_bit_range(PY.OFF_CRC, 1),
+}
+
+# (name, Python range, HDL range) for each major field
+_PY_HDL_CHECKS: Final[Tuple[Tuple[str, Tuple[int, int], Tuple[int, int]], ...]] = (
+    ("RPP_ADDRESS", _PY_RANGES["RPP_ADDRESS"], (143, 112)),
+    ("PACKET_ID", _PY_RANGES["PACKET_ID"], HDL.packet_id),
+    ("ORIGIN_REF", _PY_RANGES["ORIGIN_REF"], HDL.origin_ref),
+    ("CONSENT_BYTE", _PY_RANGES["CONSENT_BYTE"], (63, 56)),
+    ("ENTROPY_BYTE", _PY_RANGES["ENTROPY_BYTE"], (55, 48)),
+    ("FALLBACK", _PY_RANGES["FALLBACK"], HDL.fallback_vector),
+    ("WINDOW_ID", _PY_RANGES["WINDOW_ID"], HDL.coherence_window_id),
+    ("CRC", _PY_RANGES["CRC"], HDL.header_crc),
+)
+
+# Fields present in both the stub and production HDL layouts
+_SHARED_FIELDS: Final[Tuple[str, ...]] = (
+    "coherence_window_id",
+    "phase_entropy_index",
+    "fallback_vector",
+    "complecount_trace",
+    "payload_type",
+)
+
+
+def _iter_stub_hdl_pairs() -> Iterator[Tuple[str, Tuple[int, int], Tuple[int, int], bool]]:
+    """Yield (name, stub range, HDL range, match) for each shared field."""
+    for name in _SHARED_FIELDS:
+        stub_pos = getattr(STUB, name)
+        hdl_pos = getattr(HDL, name)
+        yield name, stub_pos, hdl_pos, stub_pos == hdl_pos
+
+
+# Materialized once; feeds both verify_stub_vs_production() and the report
+_STUB_HDL_ROWS: Final[Tuple[Tuple[str, Tuple[int, int], Tuple[int, int], bool], ...]] = (
+    tuple(_iter_stub_hdl_pairs())
+)
+
+_THETA_WIDTH: Final[int] = _width(HDL.rpp_theta)
+_PHI_WIDTH: Final[int] = _width(HDL.rpp_phi)
+_OMEGA_WIDTH: Final[int] = _width(HDL.rpp_omega)
+
+
 # =============================================================================
 # Alignment Verification
 # =============================================================================
@@ -151,72 +216,42 @@ def verify_bit_widths() -> List[str]:
     issues = []
     
     # Theta: 27 values need ceil(log2(27)) = 5 bits
-    hdl = HDLBitLayout()
-    theta_width = hdl.rpp_theta[0] - hdl.rpp_theta[1] + 1
-    if theta_width < 5:
-        issues.append(f"THETA needs 5 bits for 27 Repitans, HDL has {theta_width}")
+    if _THETA_WIDTH < 5:
+        issues.append(f"THETA needs 5 bits for 27 Repitans, HDL has {_THETA_WIDTH}")
     
     # Phi: 6 values need ceil(log2(6)) = 3 bits  
-    phi_width = hdl.rpp_phi[0] - hdl.rpp_phi[1] + 1
-    if phi_width < 3:
-        issues.append(f"PHI needs 3 bits for 6 RAC levels, HDL has {phi_width}")
+    if _PHI_WIDTH < 3:
+        issues.append(f"PHI needs 3 bits for 6 RAC levels, HDL has {_PHI_WIDTH}")
     
     # Omega: 5 values need ceil(log2(5)) = 3 bits
-    omega_width = hdl.rpp_omega[0] - hdl.rpp_omega[1] + 1
-    if omega_width < 3:
-        issues.append(f"OMEGA needs 3 bits for 5 formats, HDL has {omega_width}")
+    if _OMEGA_WIDTH < 3:
+        issues.append(f"OMEGA needs 3 bits for 5 formats, HDL has {_OMEGA_WIDTH}")
     
     return issues
 
 
 def verify_python_hdl_alignment() -> List[str]:
     """Verify Python byte layout matches HDL bit layout."""
-    issues = []
-    py = PythonByteLayout()
-    hdl = HDLBitLayout()
-    
-    # Check each major field
-    checks = [
-        ("RPP_ADDRESS", py.byte_to_bit_range(py.OFF_RPP_ADDRESS, 4), (143, 112)),
-        ("PACKET_ID", py.byte_to_bit_range(py.OFF_PACKET_ID, 4), hdl.packet_id),
-        ("ORIGIN_REF", py.byte_to_bit_range(py.OFF_ORIGIN_REF, 2), hdl.origin_ref),
-        ("CONSENT_BYTE", py.byte_to_bit_range(py.OFF_CONSENT, 1), (63, 56)),
-        ("ENTROPY_BYTE", py.byte_to_bit_range(py.OFF_ENTROPY, 1), (55, 48)),
-        ("FALLBACK", py.byte_to_bit_range(py.OFF_FALLBACK, 1), hdl.fallback_vector),
-        ("WINDOW_ID", py.byte_to_bit_range(py.OFF_WINDOW_ID, 2), hdl.coherence_window_id),
-        ("CRC", py.byte_to_bit_range(py.OFF_CRC, 1), hdl.header_crc),
+    return [
+        f"{name}: Python={py_range}, HDL={hdl_range} - MISMATCH"
+        for name, py_range, hdl_range in _PY_HDL_CHECKS
+        if py_range != hdl_range
     ]
-    
-    for name, py_range, hdl_range in checks:
-        if py_range != hdl_range:
-            issues.append(f"{name}: Python={py_range}, HDL={hdl_range} - MISMATCH")
-    
-    return issues
 
 
 def verify_stub_vs_production() -> List[str]:
     """Compare stub layout to production HDL layout."""
     issues = []
-    stub = StubBitLayout()
-    hdl = HDLBitLayout()
     
     # These fields exist in both but at different positions
-    comparisons = [
-        ("coherence_window_id", stub.coherence_window_id, hdl.coherence_window_id),
-        ("phase_entropy_index", stub.phase_entropy_index, hdl.phase_entropy_index),
-        ("fallback_vector", stub.fallback_vector, hdl.fallback_vector),
-        ("complecount_trace", stub.complecount_trace, hdl.complecount_trace),
-        ("payload_type", stub.payload_type, hdl.payload_type),
-    ]
-    
-    for name, stub_pos, hdl_pos in comparisons:
-        stub_width = stub_pos[0] - stub_pos[1] + 1
-        hdl_width = hdl_pos[0] - hdl_pos[1] + 1
+    for name, stub_pos, hdl_pos, match in _STUB_HDL_ROWS:
+        stub_width = _width(stub_pos)
+        hdl_width = _width(hdl_pos)
         
         if stub_width != hdl_width:
             issues.append(f"{name}: Stub width={stub_width}, HDL width={hdl_width} - WIDTH MISMATCH")
         
-        if stub_pos != hdl_pos:
+        if not match:
             issues.append(f"{name}: Stub={stub_pos}, HDL={hdl_pos} - POSITION DIFFERS")
     
     # Note: Different position is expected if stub uses a different layout
@@ -301,122 +336,131 @@ def generate_canonical_test_vectors() -> Dict[str, int]:
 # Main Verification Report
 # =============================================================================
 
+# Row templates for the layout tables
+_COMPARISON_ROW: Final[str] = "{name:<25} {stub:<20} {hdl:<20} {match}"
+_HDL_ONLY_ROW: Final[str] = "{name:<25} [{msb}:{lsb}]           {width} bits"
+
+
 def run_full_verification() -> None:
     """Run all alignment checks and report."""
-    print("=" * 70)
-    print("SPIRAL Protocol - Cross-Domain Alignment Verification")
-    print("=" * 70)
+    buf = io.StringIO()
+    
+    def emit(line: str = "") -> None:
+        buf.write(line)
+        buf.write("\n")
+    
+    emit("=" * 70)
+    emit("SPIRAL Protocol - Cross-Domain Alignment Verification")
+    emit("=" * 70)
     
     all_issues = []
     
     # Check 1: Bit widths match Ra requirements
-    print("\n[1] Ra System Bit Width Requirements:")
+    emit("\n[1] Ra System Bit Width Requirements:")
     issues = verify_bit_widths()
     if issues:
         for i in issues:
-            print(f"    ❌ {i}")
+            emit(f"    ❌ {i}")
         all_issues.extend(issues)
     else:
-        print("    ✅ All bit widths match Ra System requirements")
+        emit("    ✅ All bit widths match Ra System requirements")
     
     # Check 2: Python/HDL alignment
-    print("\n[2] Python consent_header.py ↔ HDL spiral_consent.v:")
+    emit("\n[2] Python consent_header.py ↔ HDL spiral_consent.v:")
     issues = verify_python_hdl_alignment()
     if issues:
         for i in issues:
-            print(f"    ❌ {i}")
+            emit(f"    ❌ {i}")
         all_issues.extend(issues)
     else:
-        print("    ✅ Python and HDL layouts are aligned")
+        emit("    ✅ Python and HDL layouts are aligned")
     
     # Check 3: Stub vs Production
-    print("\n[3] Stub Layout vs Production HDL Layout:")
+    emit("\n[3] Stub Layout vs Production HDL Layout:")
     issues = verify_stub_vs_production()
     if issues:
         for i in issues:
-            print(f"    ⚠️  {i}")
+            emit(f"    ⚠️  {i}")
         all_issues.extend(issues)
     else:
-        print("    ✅ Stub and production layouts match")
+        emit("    ✅ Stub and production layouts match")
     
     # Check 4: Ra constants integration
-    print("\n[4] Ra Constants Integration:")
+    emit("\n[4] Ra Constants Integration:")
     issues = verify_ra_constants_integration()
     if issues:
         for i in issues:
             if "not available" in i.lower():
-                print(f"    ⚠️  {i}")
+                emit(f"    ⚠️  {i}")
             else:
-                print(f"    ❌ {i}")
+                emit(f"    ❌ {i}")
         all_issues.extend(issues)
     else:
-        print("    ✅ Ra System properly integrated")
+        emit("    ✅ Ra System properly integrated")
     
     # Check 5: Coherence formula
-    print("\n[5] Coherence Score Formula:")
+    emit("\n[5] Coherence Score Formula:")
     issues = verify_coherence_score_formula()
     for i in issues:
-        print(f"    ⚠️  {i}")
+        emit(f"    ⚠️  {i}")
     
     # Summary
-    print("\n" + "=" * 70)
-    print("ALIGNMENT SUMMARY")
-    print("=" * 70)
+    emit("\n" + "=" * 70)
+    emit("ALIGNMENT SUMMARY")
+    emit("=" * 70)
     
     critical = [i for i in all_issues if "MISMATCH" in i or "needs" in i.lower()]
     warnings = [i for i in all_issues if i not in critical]
     
-    print(f"\n  Critical Issues: {len(critical)}")
-    print(f"  Warnings:        {len(warnings)}")
+    emit(f"\n  Critical Issues: {len(critical)}")
+    emit(f"  Warnings:        {len(warnings)}")
     
     if critical:
-        print("\n⛔ CRITICAL ISSUES THAT WILL CAUSE REDESIGN:")
+        emit("\n⛔ CRITICAL ISSUES THAT WILL CAUSE REDESIGN:")
         for i in critical:
-            print(f"    • {i}")
-    
-    print("\n" + "=" * 70)
-    print("LAYOUT COMPARISON TABLE")
-    print("=" * 70)
+            emit(f"    • {i}")
     
-    stub = StubBitLayout()
-    hdl = HDLBitLayout()
+    emit("\n" + "=" * 70)
+    emit("LAYOUT COMPARISON TABLE")
+    emit("=" * 70)
     
-    print(f"\n{'Field':<25} {'Stub [MSB:LSB]':<20} {'HDL [MSB:LSB]':<20} {'Match?'}")
-    print("-" * 70)
+    emit(f"\n{'Field':<25} {'Stub [MSB:LSB]':<20} {'HDL [MSB:LSB]':<20} {'Match?'}")
+    emit("-" * 70)
     
-    comparisons = [
-        ("coherence_window_id", stub.coherence_window_id, hdl.coherence_window_id),
-        ("phase_entropy_index", stub.phase_entropy_index, hdl.phase_entropy_index),
-        ("fallback_vector", stub.fallback_vector, hdl.fallback_vector),
-        ("complecount_trace", stub.complecount_trace, hdl.complecount_trace),
-        ("payload_type", stub.payload_type, hdl.payload_type),
-    ]
-    
-    for name, s, h in comparisons:
-        s_str = f"[{s[0]}:{s[1]}]"
-        h_str = f"[{h[0]}:{h[1]}]"
-        match = "✅" if s == h else "❌"
-        print(f"{name:<25} {s_str:<20} {h_str:<20} {match}")
+    emit("\n".join(
+        _COMPARISON_ROW.format_map({
+            "name": name,
+            "stub": f"[{s[0]}:{s[1]}]",
+            "hdl": f"[{h[0]}:{h[1]}]",
+            "match": "✅" if match else "❌",
+        })
+        for name, s, h, match in _STUB_HDL_ROWS
+    ))
     
     # Additional HDL-only fields
-    print(f"\n{'HDL-Only Fields':<25} {'Position [MSB:LSB]':<20} {'Width'}")
-    print("-" * 50)
+    emit(f"\n{'HDL-Only Fields':<25} {'Position [MSB:LSB]':<20} {'Width'}")
+    emit("-" * 50)
     hdl_only = [
-        ("rpp_theta", hdl.rpp_theta),
-        ("rpp_phi", hdl.rpp_phi),
-        ("rpp_omega", hdl.rpp_omega),
-        ("rpp_radius", hdl.rpp_radius),
-        ("packet_id", hdl.packet_id),
-        ("origin_ref", hdl.origin_ref),
-        ("consent_verbal", hdl.consent_verbal),
-        ("consent_somatic", hdl.consent_somatic),
-        ("consent_ancestral", hdl.consent_ancestral),
-        ("header_crc", hdl.header_crc),
+        ("rpp_theta", HDL.rpp_theta),
+        ("rpp_phi", HDL.rpp_phi),
+        ("rpp_omega", HDL.rpp_omega),
+        ("rpp_radius", HDL.rpp_radius),
+        ("packet_id", HDL.packet_id),
+        ("origin_ref", HDL.origin_ref),
+        ("consent_verbal", HDL.consent_verbal),
+        ("consent_somatic", HDL.consent_somatic),
+        ("consent_ancestral", HDL.consent_ancestral),
+        ("header_crc", HDL.header_crc),
     ]
     
-    for name, pos in hdl_only:
-        width = pos[0] - pos[1] + 1
-        print(f"{name:<25} [{pos[0]}:{pos[1]}]{'':>10} {width} bits")
+    emit("\n".join(
+        _HDL_ONLY_ROW.format_map({
+            "name": name, "msb": pos[0], "lsb": pos[1], "width": _width(pos),
+        })
+        for name, pos in hdl_only
+    ))
+    
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
@@ -14,13 +14,19 @@ Run: python hdl_simulation.py
 View waveforms: gtkwave spiral_sim.vcd
 """
 
+import contextlib
+import io
 import os
 import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional, Callable
+from typing import List, Dict, Tuple, Optional, Sequence, Iterable
+from collections import Counter
 from enum import IntEnum
+from array import array
 import struct
 import time
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, r'C:\Users\schmi\Documents\GitHub\rpp-spec')
@@ -30,72 +36,184 @@ sys.path.insert(0, r'C:\Users\schmi\Documents\GitHub\rpp-spec')
 # VCD Waveform Writer
 # =============================================================================
 
+# Printable characters usable in VCD signal identifiers
+_VCD_ID_CHARS = (b"!\"#$%&'()*+,-./:;<=>?@[]^_`{|}~"
+                 b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+                 b"abcdefghijklmnopqrstuvwxyz"
+                 b"0123456789")
+
+
+def _vcd_id_from_int(n: int) -> bytes:
+    """Encode a signal index as a VCD identifier (base-N over _VCD_ID_CHARS)."""
+    base = len(_VCD_ID_CHARS)
+    out = bytearray()
+    while True:
+        n, digit = divmod(n, base)
+        out.append(_VCD_ID_CHARS[digit])
+        if not n:
+            break
+    return bytes(out)
+
+
+@lru_cache(maxsize=None)
+def _vcd_bus_table(width: int) -> Tuple[bytes, ...]:
+    """Encoded b"b<bits>" value for every value of a narrow bus, shared per width."""
+    return tuple(b'b' + bin(value)[2:].zfill(width).encode()
+                 for value in range(1 << width))
+
+
 class VCDWriter:
-    """Generates Value Change Dump files for GTKWave visualization."""
+    """
+    Generates Value Change Dump files for GTKWave visualization.
+    
+    Value changes are accumulated in an in-memory byte buffer and written
+    to the (binary) file once the buffer passes FLUSH_BYTES at a timestep
+    boundary, and on end(). Writes that repeat a signal's last recorded
+    value are dropped, as only changes need to be dumped. Buses up to
+    TABLE_MAX_WIDTH bits take their encoded value from a shared
+    precomputed table instead of formatting it per change.
+    """
+    
+    FLUSH_BYTES = 64 * 1024
+    FILE_BUFFER_BYTES = 1024 * 1024
+    TABLE_MAX_WIDTH = 12
     
     def __init__(self, filename: str):
         self.filename = filename
-        self.signals: Dict[str, Tuple[str, int]] = {}  # name -> (id, width)
         self.id_counter = 0
         self.current_time = 0
         self.file = None
+        self._buf = bytearray()
+        
+        # Per-signal tables, indexed by the handle returned from add_signal()
+        self._names: List[str] = []
+        self._ids: List[bytes] = []
+        self._widths = array('i')
+        self._suffixes: List[bytes] = []         # b" <id>\n" after a bus value
+        self._scalar_suffixes: List[bytes] = []  # b"<id>\n" after a 1-bit value
+        self._last: List[Optional[int]] = []     # last value written
+        self._bus_tables: List[Optional[Tuple[bytes, ...]]] = []  # narrow buses only
+        self._handles: Dict[str, int] = {}  # full name -> handle
         
-    def _next_id(self) -> str:
+    def _next_id(self) -> bytes:
         """Generate unique signal identifier."""
-        chars = "!\"#$%&'()*+,-./:;<=>?@[]^_`{|}~"
-        chars += "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        chars += "abcdefghijklmnopqrstuvwxyz"
-        chars += "0123456789"
         idx = self.id_counter
         self.id_counter += 1
-        if idx < len(chars):
-            return chars[idx]
-        return chars[idx // len(chars)] + chars[idx % len(chars)]
+        return _vcd_id_from_int(idx)
     
-    def add_signal(self, name: str, width: int = 1, module: str = "tb") -> str:
-        """Register a signal for tracing."""
+    def add_signal(self, name: str, width: int = 1, module: str = "tb") -> int:
+        """Register a signal for tracing and return its integer handle."""
         full_name = f"{module}.{name}"
+        handle = len(self._ids)
         sig_id = self._next_id()
-        self.signals[full_name] = (sig_id, width)
-        return sig_id
+        self._names.append(name)
+        self._ids.append(sig_id)
+        self._widths.append(width)
+        self._suffixes.append(b" " + sig_id + b"\n")
+        self._scalar_suffixes.append(sig_id + b"\n")
+        self._last.append(None)
+        self._bus_tables.append(_vcd_bus_table(width)
+                                if 1 < width <= self.TABLE_MAX_WIDTH else None)
+        self._handles[full_name] = handle
+        return handle
     
     def begin(self):
         """Write VCD header."""
-        self.file = open(self.filename, 'w')
-        self.file.write(f"$date\n   {time.strftime('%Y-%m-%d %H:%M:%S')}\n$end\n")
-        self.file.write("$version\n   SPIRAL HDL Simulation v2.0\n$end\n")
-        self.file.write("$timescale 1ns $end\n")
-        
-        # Write signal definitions
-        self.file.write("$scope module tb $end\n")
-        for name, (sig_id, width) in self.signals.items():
-            short_name = name.split('.')[-1]
-            self.file.write(f"$var wire {width} {sig_id} {short_name} $end\n")
-        self.file.write("$upscope $end\n")
-        self.file.write("$enddefinitions $end\n")
-        self.file.write("#0\n")
-        self.file.write("$dumpvars\n")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        # Windows-only hint that the dump is written front to back
+        flags |= getattr(os, 'O_SEQUENTIAL', 0)
+        self.file = os.fdopen(os.open(self.filename, flags, 0o666), 'wb',
+                              buffering=self.FILE_BUFFER_BYTES)
+        self._buf.clear()
+        lines = [
+            f"$date\n   {time.strftime('%Y-%m-%d %H:%M:%S')}\n$end\n",
+            "$version\n   SPIRAL HDL Simulation v2.0\n$end\n",
+            "$timescale 1ns $end\n",
+            "$scope module tb $end\n",
+        ]
         
-    def change(self, name: str, value: int, module: str = "tb"):
-        """Record a value change."""
-        full_name = f"{module}.{name}"
-        if full_name not in self.signals:
+        # Signal definitions
+        for name, sig_id, width in zip(self._names, self._ids, self._widths):
+            lines.append(f"$var wire {width} {sig_id.decode()} {name} $end\n")
+        lines.append("$upscope $end\n")
+        lines.append("$enddefinitions $end\n")
+        lines.append("#0\n")
+        lines.append("$dumpvars\n")
+        self._buf += "".join(lines).encode()
+        
+    def change_by_id(self, handle: int, value: int):
+        """Record a value change for a signal handle from add_signal()."""
+        if self._last[handle] == value:
             return
-        sig_id, width = self.signals[full_name]
+        self._last[handle] = value
+        width = self._widths[handle]
+        buf = self._buf
         if width == 1:
-            self.file.write(f"{value}{sig_id}\n")
+            buf.append(0x30 + value)  # ASCII '0' / '1'
+            buf += self._scalar_suffixes[handle]
         else:
-            self.file.write(f"b{value:0{width}b} {sig_id}\n")
+            table = self._bus_tables[handle]
+            if table is not None and value < len(table):
+                buf += table[value]
+            else:
+                # bin()+zfill() avoids parsing a format spec on every change
+                buf += b'b'
+                buf += bin(value)[2:].zfill(width).encode()
+            buf += self._suffixes[handle]
+    
+    def dump_array(self, handles: Sequence[int], values: Sequence[int]):
+        """Record value changes for a bank of signals in one buffered pass."""
+        self.change_many(zip(handles, values))
+    
+    def change_many(self, pairs: Iterable[Tuple[int, int]]):
+        """Record value changes for (handle, value) pairs in one buffered pass."""
+        widths = self._widths
+        suffixes = self._suffixes
+        scalar_suffixes = self._scalar_suffixes
+        bus_tables = self._bus_tables
+        last = self._last
+        parts = []
+        for h, value in pairs:
+            if last[h] == value:
+                continue
+            last[h] = value
+            width = widths[h]
+            if width == 1:
+                parts.append(b'%d' % value)
+                parts.append(scalar_suffixes[h])
+                continue
+            table = bus_tables[h]
+            if table is not None and value < len(table):
+                parts.append(table[value])
+            else:
+                parts.append(b'b' + bin(value)[2:].zfill(width).encode())
+            parts.append(suffixes[h])
+        self._buf += b''.join(parts)
+    
+    def change(self, name: str, value: int, module: str = "tb"):
+        """Record a value change by signal name."""
+        handle = self._handles.get(f"{module}.{name}")
+        if handle is None:
+            return
+        self.change_by_id(handle, value)
     
     def advance(self, time_ns: int):
         """Advance simulation time."""
         if time_ns > self.current_time:
             self.current_time = time_ns
-            self.file.write(f"#{time_ns}\n")
+            if len(self._buf) >= self.FLUSH_BYTES:
+                self._flush()
+            self._buf += b"#%d\n" % time_ns
+    
+    def _flush(self):
+        """Write buffered changes to the file."""
+        self.file.write(self._buf)
+        self._buf.clear()
     
     def end(self):
-        """Close VCD file."""
+        """Flush pending changes and close VCD file."""
         if self.file:
+            self._flush()
             self.file.close()
 
 
@@ -110,6 +228,10 @@ class ConsentState(IntEnum):
     EMERGENCY_OVERRIDE = 3
 
 
+# Plain-int consent codes for hot comparisons (IntEnum __eq__ runs in Python)
+_FULL_CONSENT = int(ConsentState.FULL_CONSENT)
+
+
 # =============================================================================
 # HDL Module Behavioral Models
 # =============================================================================
@@ -129,14 +251,86 @@ class ConsentHeaderParser:
     payload_type: int = 0           # [112:109] 4 bits
     consent_state: int = 0          # [108:107] 2 bits
     
+    # All stub outputs live in header[143:107]. That 37-bit word is shifted
+    # out of the 144-bit header once; each field is then masked from it.
+    FIELD_WORD_LSB = 107
+    
+    # (field, shift within the field word, mask), MSB first
+    FIELDS = (
+        ("coherence_window_id", 25, 0xFFF),
+        ("phase_entropy_index", 19, 0x3F),
+        ("fallback_vector", 11, 0xFF),
+        ("complecount_trace", 6, 0x1F),
+        ("payload_type", 2, 0xF),
+        ("consent_state", 0, 0x3),
+    )
+    
     def parse(self, consent_header: int) -> None:
         """Parse header using stub bit positions."""
-        self.coherence_window_id = (consent_header >> 132) & 0xFFF
-        self.phase_entropy_index = (consent_header >> 126) & 0x3F
-        self.fallback_vector = (consent_header >> 118) & 0xFF
-        self.complecount_trace = (consent_header >> 113) & 0x1F
-        self.payload_type = (consent_header >> 109) & 0xF
-        self.consent_state = (consent_header >> 107) & 0x3
+        (self.coherence_window_id, self.phase_entropy_index,
+         self.fallback_vector, self.complecount_trace,
+         self.payload_type, self.consent_state) = _parse_fields(consent_header)
+    
+    def parse_bytes(self, consent_header: bytes) -> None:
+        """Parse an 18-byte big-endian header (byte 0 = header[143:136])."""
+        (self.coherence_window_id, self.phase_entropy_index,
+         self.fallback_vector, self.complecount_trace,
+         self.payload_type, self.consent_state) = _unpack_fields(consent_header)
+    
+    def parse_batch(self, consent_headers: Sequence[int]) -> Dict[str, array]:
+        """
+        Parse a window of headers in one pass per field.
+        
+        Returns one unsigned 16-bit column per output, indexed like the
+        input. The outputs are left holding the last header, as the
+        registers would after the burst.
+        """
+        lsb = self.FIELD_WORD_LSB
+        words = [h >> lsb for h in consent_headers]
+        columns = {
+            name: array('H', [(w >> shift) & mask for w in words])
+            for name, shift, mask in self.FIELDS
+        }
+        if consent_headers:
+            self.parse(consent_headers[-1])
+        return columns
+
+
+# (shift, mask) of each stub output within the field word, FIELDS order
+_FIELD_SLICES = tuple((shift, mask) for _, shift, mask in ConsentHeaderParser.FIELDS)
+
+
+def _split_field_word(word: int) -> Tuple[int, ...]:
+    """Stub outputs of a header[143:107] field word, in FIELDS order."""
+    return tuple([(word >> shift) & mask for shift, mask in _FIELD_SLICES])
+
+
+@lru_cache(maxsize=1024)
+def _parse_fields(consent_header: int) -> Tuple[int, ...]:
+    """
+    Extract the stub outputs of a header, in ConsentHeaderParser.FIELDS order.
+    
+    The parse is a pure function of the header value, so repeated headers
+    are served from the cache.
+    """
+    return _split_field_word(consent_header >> ConsentHeaderParser.FIELD_WORD_LSB)
+
+
+# header[143:104] as the first 40 bits of the 18-byte wire form, and the
+# number of bits of that prefix below the field word
+_FIELD_BYTES = struct.Struct(">IB")
+_FIELD_BYTES_PAD = ConsentHeaderParser.FIELD_WORD_LSB - (144 - 8 * _FIELD_BYTES.size)
+
+
+def _unpack_fields(consent_header: bytes) -> Tuple[int, ...]:
+    """
+    Extract the stub outputs from an 18-byte big-endian header.
+    
+    Only bytes 0-4 carry stub fields, so the field word is rebuilt from
+    one struct unpack without forming the 144-bit integer.
+    """
+    top, low = _FIELD_BYTES.unpack_from(consent_header)
+    return _split_field_word(((top << 8) | low) >> _FIELD_BYTES_PAD)
 
 
 @dataclass
@@ -158,6 +352,24 @@ class CoherenceEvaluator:
         self.coherence_score = (phase_entropy_index << 1) + complecount_trace
         self.coherence_score &= 0x7F  # 7-bit result
         self.coherence_valid = self.coherence_score >= pmq_threshold
+    
+    def evaluate_batch(self, phase_entropy_indices: Sequence[int],
+                       complecount_traces: Sequence[int],
+                       pmq_threshold: int) -> Tuple[array, List[bool]]:
+        """
+        Evaluate a window of samples against one threshold.
+        
+        Returns (scores, valid) columns; the outputs are left holding the
+        last sample.
+        """
+        scores = array('B', [((pe << 1) + cc) & 0x7F
+                             for pe, cc in zip(phase_entropy_indices,
+                                               complecount_traces)])
+        valid = [score >= pmq_threshold for score in scores]
+        if scores:
+            self.coherence_score = scores[-1]
+            self.coherence_valid = valid[-1]
+        return scores, valid
 
 
 @dataclass
@@ -178,6 +390,33 @@ class FallbackResolver:
             self.rpp_fallback_address = 0  # High-Z in real HDL
 
 
+def _run_scalar_trigger(enables: Sequence[bool], radii: Sequence[int],
+                        activation_threshold: int, coherence_duration: int,
+                        counter: int, triggered: bool
+                        ) -> Tuple[List[int], List[bool], int, bool]:
+    """
+    Clock the ScalarTrigger state machine over a window of cycles.
+    
+    Returns the per-cycle (counter, triggered) traces plus the final state.
+    """
+    counter_trace = []
+    triggered_trace = []
+    for enable, radius in zip(enables, radii):
+        if not enable:
+            triggered = False
+        elif radius >= activation_threshold:
+            if counter < coherence_duration:
+                counter += 1
+            else:
+                triggered = True
+        else:
+            counter = 0
+            triggered = False
+        counter_trace.append(counter)
+        triggered_trace.append(triggered)
+    return counter_trace, triggered_trace, counter, triggered
+
+
 @dataclass
 class ScalarTrigger:
     """
@@ -208,6 +447,16 @@ class ScalarTrigger:
         else:
             self.coherence_counter = 0
             self.scalar_triggered = False
+    
+    def clock_batch(self, enables: Sequence[bool], radii: Sequence[int],
+                    activation_threshold: int, coherence_duration: int
+                    ) -> Tuple[List[int], List[bool]]:
+        """Process a window of clock cycles, returning per-cycle traces."""
+        counters, triggers, self.coherence_counter, self.scalar_triggered = \
+            _run_scalar_trigger(enables, radii, activation_threshold,
+                                coherence_duration, self.coherence_counter,
+                                self.scalar_triggered)
+        return counters, triggers
 
 
 @dataclass
@@ -219,6 +468,7 @@ class PhaseMemoryAnchorRAM:
     """
     depth: int = 64
     memory: List[int] = field(default_factory=list)
+    vcd_handles: List[int] = field(default_factory=list, repr=False)
     
     def __post_init__(self):
         self.memory = [0] * self.depth
@@ -233,6 +483,16 @@ class PhaseMemoryAnchorRAM:
         if 0 <= addr < self.depth:
             return self.memory[addr]
         return 0
+    
+    def add_vcd_signals(self, vcd: VCDWriter, prefix: str = "pma_mem") -> None:
+        """Register one 144-bit VCD signal per RAM entry."""
+        self.vcd_handles = [vcd.add_signal(f"{prefix}_{addr}", 144)
+                            for addr in range(self.depth)]
+    
+    def dump_vcd(self, vcd: VCDWriter) -> None:
+        """Snapshot the whole RAM image into the VCD."""
+        vcd.dump_array(self.vcd_handles,
+                       [self.read(addr) for addr in range(self.depth)])
 
 
 # =============================================================================
@@ -242,9 +502,64 @@ class PhaseMemoryAnchorRAM:
 class SpiralTestbench:
     """
     Comprehensive testbench for SPIRAL HDL modules.
+    
+    With emit_clock=False the VCD gets one timestep per cycle and no clk
+    toggles. The models are clocked by the test code, not by VCD time, so
+    this only drops the edge detail from the waveform.
+    
+    With verbose_pass=False only failing checks are traced; passes are
+    still counted.
     """
     
-    def __init__(self, vcd_filename: str = "spiral_sim.vcd"):
+    # Reserved bits [106:0] below the canonical fields
+    RESERVED_MASK = (1 << 107) - 1
+    
+    # Consent header test vectors: (canonical field values, description).
+    # Each case is expected to parse back to its own field values.
+    CONSENT_CASES = (
+        # Edge case: All zeros
+        ((0, 0, 0, 0, 0, 0), "All zeros"),
+        
+        # Edge case: All ones in canonical fields
+        ((0xFFF, 0x3F, 0xFF, 0x1F, 0xF, 0x3), "All ones"),
+        
+        # FULL_CONSENT packet (consent=0b00)
+        ((0x001, 0x08, 0x2A, 0x05, 0x1, 0x0), "FULL_CONSENT packet"),
+        
+        # DIMINISHED_CONSENT packet (consent=0b01)
+        ((0x100, 0x10, 0x55, 0x0A, 0x2, 0x1), "DIMINISHED_CONSENT packet"),
+        
+        # SUSPENDED_CONSENT packet (consent=0b10)
+        ((0x800, 0x20, 0xAA, 0x0F, 0x4, 0x2), "SUSPENDED_CONSENT packet"),
+        
+        # EMERGENCY_OVERRIDE packet (consent=0b11)
+        ((0xCAF, 0x3F, 0xFF, 0x1F, 0x8, 0x3), "EMERGENCY_OVERRIDE packet"),
+        
+        # Window ID boundary: MSB only
+        ((0x800, 0, 0, 0, 0, 0), "Window ID MSB"),
+        
+        # Window ID boundary: LSB only
+        ((0x001, 0, 0, 0, 0, 0), "Window ID LSB"),
+        
+        # High entropy (fallback trigger candidate)
+        ((0x123, 0x38, 0xBE, 0x10, 0x3, 0x0), "High entropy (56)"),
+        
+        # Avatar payload type (0x3)
+        ((0x456, 0x0C, 0x42, 0x08, 0x3, 0x0), "Avatar payload"),
+    )
+    
+    # FallbackResolver vectors: (trigger, vector, expected address, description)
+    FALLBACK_CASES = (
+        (True, 0x00, 0x00000000, "Zero vector"),
+        (True, 0xFF, 0x000000FF, "Full vector"),
+        (True, 0x2A, 0x0000002A, "0x2A vector"),
+        (True, 0x55, 0x00000055, "0x55 vector"),
+        (True, 0xAA, 0x000000AA, "0xAA vector"),
+        (False, 0xFF, 0, "Trigger disabled"),
+    )
+    
+    def __init__(self, vcd_filename: str = "spiral_sim.vcd", emit_clock: bool = True,
+                 verbose_pass: bool = True):
         # Instantiate modules
         self.parser = ConsentHeaderParser()
         self.coherence = CoherenceEvaluator()
@@ -254,73 +569,101 @@ class SpiralTestbench:
         
         # VCD writer
         self.vcd = VCDWriter(vcd_filename)
+        self.emit_clock = emit_clock
         self._setup_vcd_signals()
         
+        # Consent headers are built once per testbench from CONSENT_CASES,
+        # in their 18-byte wire form
+        self._consent_vectors = tuple(
+            (self._build_consent_header(*fields).to_bytes(18, 'big'), *fields, desc)
+            for fields, desc in self.CONSENT_CASES
+        )
+        
         # Test statistics
+        self.verbose_pass = verbose_pass
         self.test_count = 0
         self.pass_count = 0
         self.fail_count = 0
-        self.coverage: Dict[str, int] = {}
+        self.coverage: Counter = Counter()
+        self._pending_cov: List[str] = []  # hits not yet folded into coverage
         
         # Trace log
-        self.trace_log: List[str] = []
+        self.trace_log = io.StringIO()
         
         # Simulation time
         self.time_ns = 0
         self.clock_period = 10  # 100 MHz
         
+    def _add_signal(self, name: str, width: int) -> int:
+        """Register a testbench signal and remember its VCD handle."""
+        handle = self.vcd.add_signal(name, width)
+        self._vcd_handles[name] = handle
+        return handle
+    
     def _setup_vcd_signals(self):
         """Register signals for VCD tracing."""
+        self._vcd_handles: Dict[str, int] = {}
+        
         # Clock and control
-        self.vcd.add_signal("clk", 1)
-        self.vcd.add_signal("reset", 1)
-        self.vcd.add_signal("enable", 1)
+        self.h_clk = self._add_signal("clk", 1)
+        self.h_reset = self._add_signal("reset", 1)
+        self.h_enable = self._add_signal("enable", 1)
         
         # Parser outputs
-        self.vcd.add_signal("coherence_window_id", 12)
-        self.vcd.add_signal("phase_entropy_index", 6)
-        self.vcd.add_signal("fallback_vector", 8)
-        self.vcd.add_signal("complecount_trace", 5)
-        self.vcd.add_signal("payload_type", 4)
-        self.vcd.add_signal("consent_state", 2)
+        self.h_coherence_window_id = self._add_signal("coherence_window_id", 12)
+        self.h_phase_entropy_index = self._add_signal("phase_entropy_index", 6)
+        self.h_fallback_vector = self._add_signal("fallback_vector", 8)
+        self.h_complecount_trace = self._add_signal("complecount_trace", 5)
+        self.h_payload_type = self._add_signal("payload_type", 4)
+        self.h_consent_state = self._add_signal("consent_state", 2)
         
         # Coherence evaluator
-        self.vcd.add_signal("coherence_score", 7)
-        self.vcd.add_signal("coherence_valid", 1)
-        self.vcd.add_signal("pmq_threshold", 7)
+        self.h_coherence_score = self._add_signal("coherence_score", 7)
+        self.h_coherence_valid = self._add_signal("coherence_valid", 1)
+        self.h_pmq_threshold = self._add_signal("pmq_threshold", 7)
         
         # Scalar trigger
-        self.vcd.add_signal("radius", 8)
-        self.vcd.add_signal("activation_threshold", 7)
-        self.vcd.add_signal("coherence_duration", 8)
-        self.vcd.add_signal("coherence_counter", 8)
-        self.vcd.add_signal("scalar_triggered", 1)
+        self.h_radius = self._add_signal("radius", 8)
+        self.h_activation_threshold = self._add_signal("activation_threshold", 7)
+        self.h_coherence_duration = self._add_signal("coherence_duration", 8)
+        self.h_coherence_counter = self._add_signal("coherence_counter", 8)
+        self.h_scalar_triggered = self._add_signal("scalar_triggered", 1)
         
         # Fallback
-        self.vcd.add_signal("trigger_fallback", 1)
-        self.vcd.add_signal("rpp_fallback_address", 32)
+        self.h_trigger_fallback = self._add_signal("trigger_fallback", 1)
+        self.h_rpp_fallback_address = self._add_signal("rpp_fallback_address", 32)
+        
+        # PMA RAM image
+        self.pma_ram.add_vcd_signals(self.vcd)
         
     def _record_vcd(self, **signals):
         """Record signals to VCD."""
-        for name, value in signals.items():
-            self.vcd.change(name, value)
+        handles = self._vcd_handles
+        self.vcd.change_many([(handles[name], value)
+                              for name, value in signals.items()])
     
     def _clock_cycle(self):
         """Advance one clock cycle."""
+        if not self.emit_clock:
+            self.vcd.advance(self.time_ns)
+            self.time_ns += self.clock_period
+            return
+        
         # Rising edge
         self.vcd.advance(self.time_ns)
-        self._record_vcd(clk=1)
+        self.vcd.change_by_id(self.h_clk, 1)
         self.time_ns += self.clock_period // 2
         
         # Falling edge
         self.vcd.advance(self.time_ns)
-        self._record_vcd(clk=0)
+        self.vcd.change_by_id(self.h_clk, 0)
         self.time_ns += self.clock_period // 2
     
     def _log(self, msg: str):
-        """Add to trace log."""
-        self.trace_log.append(f"[{self.time_ns:6d}ns] {msg}")
-        print(f"[{self.time_ns:6d}ns] {msg}")
+        """Add to trace log and echo to stdout."""
+        line = f"[{self.time_ns:6d}ns] {msg}\n"
+        self.trace_log.write(line)
+        sys.stdout.write(line)
     
     def _check(self, name: str, actual, expected, tolerance=0) -> bool:
         """Check a test condition."""
@@ -333,19 +676,25 @@ class SpiralTestbench:
         
         if passed:
             self.pass_count += 1
-            self._log(f"  [PASS] {name}: {actual}")
+            if self.verbose_pass:
+                self._log(f"  [PASS] {name}: {actual}")
         else:
             self.fail_count += 1
             self._log(f"  [FAIL] {name}: got {actual}, expected {expected}")
         
         # Track coverage
-        self.coverage[name] = self.coverage.get(name, 0) + 1
+        self._pending_cov.append(name)
         
         return passed
     
     def _record_coverage(self, category: str):
         """Record test coverage."""
-        self.coverage[category] = self.coverage.get(category, 0) + 1
+        self._pending_cov.append(category)
+    
+    def _flush_coverage(self):
+        """Fold pending coverage hits into the coverage counter."""
+        self.coverage.update(self._pending_cov)
+        self._pending_cov.clear()
     
     # =========================================================================
     # Test Cases
@@ -366,15 +715,12 @@ class SpiralTestbench:
           [108:107] consent_state        (2 bits)
           [106:0]   reserved             (107 bits)
         """
-        header = 0
-        header |= (window_id & 0xFFF) << 132
-        header |= (entropy & 0x3F) << 126
-        header |= (fallback & 0xFF) << 118
-        header |= (complecount & 0x1F) << 113
-        header |= (payload & 0xF) << 109
-        header |= (consent & 0x3) << 107
-        header |= (reserved & ((1 << 107) - 1))
-        return header
+        # Pack the 37-bit field word [143:107] with small-int shifts, then
+        # move it into place with a single big-int shift.
+        word = ((((((window_id & 0xFFF) << 6 | entropy & 0x3F) << 8
+                   | fallback & 0xFF) << 5 | complecount & 0x1F) << 4
+                 | payload & 0xF) << 2 | consent & 0x3)
+        return (word << ConsentHeaderParser.FIELD_WORD_LSB) | (reserved & self.RESERVED_MASK)
     
     def test_consent_header_edge_cases(self):
         """Test 1: Consent Header Parser edge cases (Canonical Layout)."""
@@ -382,75 +728,48 @@ class SpiralTestbench:
         self._log("TEST 1: ConsentHeaderParser Edge Cases (Canonical)")
         self._log("=" * 60)
         
-        # Build test vectors using canonical field builder
-        test_vectors = [
-            # (header, expected_window_id, expected_entropy, expected_fallback, 
-            #  expected_complecount, expected_payload, expected_consent, description)
-            
-            # Edge case: All zeros
-            (self._build_consent_header(0, 0, 0, 0, 0, 0), 
-             0, 0, 0, 0, 0, 0, "All zeros"),
-            
-            # Edge case: All ones in canonical fields
-            (self._build_consent_header(0xFFF, 0x3F, 0xFF, 0x1F, 0xF, 0x3),
-             0xFFF, 0x3F, 0xFF, 0x1F, 0xF, 0x3, "All ones"),
-            
-            # FULL_CONSENT packet (consent=0b00)
-            (self._build_consent_header(0x001, 0x08, 0x2A, 0x05, 0x1, 0x0),
-             0x001, 0x08, 0x2A, 0x05, 0x1, 0x0, "FULL_CONSENT packet"),
-            
-            # DIMINISHED_CONSENT packet (consent=0b01)
-            (self._build_consent_header(0x100, 0x10, 0x55, 0x0A, 0x2, 0x1),
-             0x100, 0x10, 0x55, 0x0A, 0x2, 0x1, "DIMINISHED_CONSENT packet"),
-            
-            # SUSPENDED_CONSENT packet (consent=0b10)
-            (self._build_consent_header(0x800, 0x20, 0xAA, 0x0F, 0x4, 0x2),
-             0x800, 0x20, 0xAA, 0x0F, 0x4, 0x2, "SUSPENDED_CONSENT packet"),
-            
-            # EMERGENCY_OVERRIDE packet (consent=0b11)
-            (self._build_consent_header(0xCAF, 0x3F, 0xFF, 0x1F, 0x8, 0x3),
-             0xCAF, 0x3F, 0xFF, 0x1F, 0x8, 0x3, "EMERGENCY_OVERRIDE packet"),
-            
-            # Window ID boundary: MSB only
-            (self._build_consent_header(0x800, 0, 0, 0, 0, 0),
-             0x800, 0, 0, 0, 0, 0, "Window ID MSB"),
-            
-            # Window ID boundary: LSB only
-            (self._build_consent_header(0x001, 0, 0, 0, 0, 0),
-             0x001, 0, 0, 0, 0, 0, "Window ID LSB"),
-            
-            # High entropy (fallback trigger candidate)
-            (self._build_consent_header(0x123, 0x38, 0xBE, 0x10, 0x3, 0x0),
-             0x123, 0x38, 0xBE, 0x10, 0x3, 0x0, "High entropy (56)"),
-            
-            # Avatar payload type (0x3)
-            (self._build_consent_header(0x456, 0x0C, 0x42, 0x08, 0x3, 0x0),
-             0x456, 0x0C, 0x42, 0x08, 0x3, 0x0, "Avatar payload"),
-        ]
+        parser = self.parser
+        log = self._log
+        check = self._check
+        record_vcd = self._record_vcd
+        clock_cycle = self._clock_cycle
+        record_coverage = self._record_coverage
         
-        for header, exp_wid, exp_ent, exp_fb, exp_cc, exp_pt, exp_cs, desc in test_vectors:
-            self._log(f"\n  Testing: {desc}")
-            self.parser.parse(header)
+        for header, exp_wid, exp_ent, exp_fb, exp_cc, exp_pt, exp_cs, desc in self._consent_vectors:
+            log(f"\n  Testing: {desc}")
+            parser.parse_bytes(header)
             
-            self._check(f"window_id ({desc})", self.parser.coherence_window_id, exp_wid)
-            self._check(f"entropy ({desc})", self.parser.phase_entropy_index, exp_ent)
-            self._check(f"fallback ({desc})", self.parser.fallback_vector, exp_fb)
-            self._check(f"complecount ({desc})", self.parser.complecount_trace, exp_cc)
-            self._check(f"payload ({desc})", self.parser.payload_type, exp_pt)
-            self._check(f"consent ({desc})", self.parser.consent_state, exp_cs)
+            check(f"window_id ({desc})", parser.coherence_window_id, exp_wid)
+            check(f"entropy ({desc})", parser.phase_entropy_index, exp_ent)
+            check(f"fallback ({desc})", parser.fallback_vector, exp_fb)
+            check(f"complecount ({desc})", parser.complecount_trace, exp_cc)
+            check(f"payload ({desc})", parser.payload_type, exp_pt)
+            check(f"consent ({desc})", parser.consent_state, exp_cs)
             
             # Record VCD
-            self._record_vcd(
-                coherence_window_id=self.parser.coherence_window_id,
-                phase_entropy_index=self.parser.phase_entropy_index,
-                fallback_vector=self.parser.fallback_vector,
-                complecount_trace=self.parser.complecount_trace,
-                payload_type=self.parser.payload_type,
-                consent_state=self.parser.consent_state
+            record_vcd(
+                coherence_window_id=parser.coherence_window_id,
+                phase_entropy_index=parser.phase_entropy_index,
+                fallback_vector=parser.fallback_vector,
+                complecount_trace=parser.complecount_trace,
+                payload_type=parser.payload_type,
+                consent_state=parser.consent_state
             )
-            self._clock_cycle()
+            clock_cycle()
             
-            self._record_coverage("consent_header_parse")
+            record_coverage("consent_header_parse")
+        
+        # The integer and batch paths must decode the same vectors
+        names = [name for name, _, _ in parser.FIELDS]
+        headers = [int.from_bytes(header, 'big') for header, *_ in self._consent_vectors]
+        columns = parser.parse_batch(headers)
+        for i, (header, (_, *expected, desc)) in enumerate(zip(headers, self._consent_vectors)):
+            parser.parse(header)
+            check(f"parse ({desc})",
+                  tuple(getattr(parser, name) for name in names), tuple(expected))
+            check(f"parse_batch ({desc})",
+                  tuple(columns[name][i] for name in names), tuple(expected))
+            record_coverage("consent_header_parse_int")
     
     def test_coherence_evaluator_sweep(self):
         """Test 2: CoherenceEvaluator full sweep."""
@@ -460,40 +779,62 @@ class SpiralTestbench:
         
         thresholds = [30, 45, 63, 100, 127]
         
+        # Sample sweep (full sweep would be 64Ã—32 = 2048 combinations),
+        # flattened once into entropy/complecount columns
+        grid = [(entropy, complecount)
+                for entropy in [0, 10, 20, 31, 40, 50, 63]
+                for complecount in [0, 8, 16, 24, 31]]
+        entropies = [entropy for entropy, _ in grid]
+        complecounts = [complecount for _, complecount in grid]
+        
+        # Expected: score = (entropy << 1) + complecount
+        expected_scores = [((entropy << 1) + complecount) & 0x7F
+                           for entropy, complecount in grid]
+        
+        coherence = self.coherence
+        evaluate = coherence.evaluate
+        evaluate_batch = coherence.evaluate_batch
+        record_vcd = self._record_vcd
+        clock_cycle = self._clock_cycle
+        check = self._check
+        record_coverage = self._record_coverage
+        
         for threshold in thresholds:
             self._log(f"\n  Threshold: {threshold}")
+            scores, valids = evaluate_batch(entropies, complecounts, threshold)
             
-            # Sample sweep (full sweep would be 64Ã—32 = 2048 combinations)
-            for entropy in [0, 10, 20, 31, 40, 50, 63]:
-                for complecount in [0, 8, 16, 24, 31]:
-                    self.coherence.evaluate(entropy, complecount, threshold)
-                    
-                    # Expected: score = (entropy << 1) + complecount
-                    expected_score = ((entropy << 1) + complecount) & 0x7F
-                    expected_valid = expected_score >= threshold
-                    
-                    self._check(
-                        f"score(e={entropy},c={complecount},t={threshold})",
-                        self.coherence.coherence_score,
-                        expected_score
-                    )
-                    self._check(
-                        f"valid(e={entropy},c={complecount},t={threshold})",
-                        self.coherence.coherence_valid,
-                        expected_valid
-                    )
-                    
-                    # Record VCD
-                    self._record_vcd(
-                        phase_entropy_index=entropy,
-                        complecount_trace=complecount,
-                        pmq_threshold=threshold,
-                        coherence_score=self.coherence.coherence_score,
-                        coherence_valid=int(self.coherence.coherence_valid)
-                    )
-                    self._clock_cycle()
-                    
-                    self._record_coverage("coherence_sweep")
+            for (entropy, complecount), score, valid, expected_score in zip(
+                    grid, scores, valids, expected_scores):
+                check(
+                    f"score(e={entropy},c={complecount},t={threshold})",
+                    score,
+                    expected_score
+                )
+                check(
+                    f"valid(e={entropy},c={complecount},t={threshold})",
+                    valid,
+                    expected_score >= threshold
+                )
+                
+                # The per-sample model must agree with the batch columns
+                evaluate(entropy, complecount, threshold)
+                check(
+                    f"evaluate(e={entropy},c={complecount},t={threshold})",
+                    (coherence.coherence_score, coherence.coherence_valid),
+                    (expected_score, expected_score >= threshold)
+                )
+                
+                # Record VCD
+                record_vcd(
+                    phase_entropy_index=entropy,
+                    complecount_trace=complecount,
+                    pmq_threshold=threshold,
+                    coherence_score=score,
+                    coherence_valid=int(valid)
+                )
+                clock_cycle()
+                
+                record_coverage("coherence_sweep")
     
     def test_scalar_trigger_timing(self):
         """Test 3: ScalarTrigger timing and duration."""
@@ -501,53 +842,60 @@ class SpiralTestbench:
         self._log("TEST 3: ScalarTrigger Timing")
         self._log("=" * 60)
         
+        scalar = self.scalar
+        record_vcd = self._record_vcd
+        clock_cycle = self._clock_cycle
+        check = self._check
+        
         # Test various durations
         for duration in [1, 2, 3, 5, 10]:
             self._log(f"\n  Duration: {duration}")
-            self.scalar.reset()
+            scalar.reset()
             
             threshold = 40
             radius_high = 50  # Above threshold
             radius_low = 30   # Below threshold
             
-            self._record_vcd(
+            record_vcd(
                 reset=1,
                 activation_threshold=threshold,
                 coherence_duration=duration
             )
-            self._clock_cycle()
-            self._record_vcd(reset=0, enable=1)
+            clock_cycle()
+            record_vcd(reset=0, enable=1)
             
             # Apply high radius for (duration + 2) cycles
             self._log(f"    Applying radius={radius_high} (above threshold)")
-            for cycle in range(duration + 2):
-                self.scalar.clock(True, radius_high, threshold, duration)
-                
-                self._record_vcd(
+            n_cycles = duration + 2
+            counters, triggers = scalar.clock_batch(
+                [True] * n_cycles, [radius_high] * n_cycles, threshold, duration)
+            
+            for cycle, (counter, triggered) in enumerate(zip(counters, triggers)):
+                record_vcd(
                     radius=radius_high,
-                    coherence_counter=self.scalar.coherence_counter,
-                    scalar_triggered=int(self.scalar.scalar_triggered)
+                    coherence_counter=counter,
+                    scalar_triggered=int(triggered)
                 )
-                self._clock_cycle()
+                clock_cycle()
                 
                 expected_triggered = cycle >= duration
-                self._check(
+                check(
                     f"triggered@cycle{cycle}(d={duration})",
-                    self.scalar.scalar_triggered,
+                    triggered,
                     expected_triggered
                 )
             
             # Reset with low radius
             self._log(f"    Applying radius={radius_low} (below threshold)")
-            self.scalar.clock(True, radius_low, threshold, duration)
-            self._check(
+            scalar.clock(True, radius_low, threshold, duration)
+            check(
                 f"reset_after_low(d={duration})",
-                self.scalar.scalar_triggered,
+                scalar.scalar_triggered,
                 False
             )
-            self._check(
+            check(
                 f"counter_reset(d={duration})",
-                self.scalar.coherence_counter,
+                scalar.coherence_counter,
                 0
             )
             
@@ -558,13 +906,15 @@ class SpiralTestbench:
         self.scalar.reset()
         oscillation = [50, 50, 30, 50, 50, 50, 50, 50]  # Dip in middle
         
-        for i, r in enumerate(oscillation):
-            self.scalar.clock(True, r, 40, 3)
-            self._log(f"    Cycle {i}: radius={r}, counter={self.scalar.coherence_counter}, triggered={self.scalar.scalar_triggered}")
+        counters, triggers = self.scalar.clock_batch(
+            [True] * len(oscillation), oscillation, 40, 3)
+        
+        for i, (r, counter, triggered) in enumerate(zip(oscillation, counters, triggers)):
+            self._log(f"    Cycle {i}: radius={r}, counter={counter}, triggered={triggered}")
             self._record_vcd(
                 radius=r,
-                coherence_counter=self.scalar.coherence_counter,
-                scalar_triggered=int(self.scalar.scalar_triggered)
+                coherence_counter=counter,
+                scalar_triggered=int(triggered)
             )
             self._clock_cycle()
             self._record_coverage("scalar_oscillation")
@@ -575,16 +925,7 @@ class SpiralTestbench:
         self._log("TEST 4: FallbackResolver XOR Logic")
         self._log("=" * 60)
         
-        test_vectors = [
-            (True, 0x00, 0x00000000, "Zero vector"),
-            (True, 0xFF, 0x000000FF, "Full vector"),
-            (True, 0x2A, 0x0000002A, "0x2A vector"),
-            (True, 0x55, 0x00000055, "0x55 vector"),
-            (True, 0xAA, 0x000000AA, "0xAA vector"),
-            (False, 0xFF, 0, "Trigger disabled"),
-        ]
-        
-        for trigger, vector, expected_addr, desc in test_vectors:
+        for trigger, vector, expected_addr, desc in self.FALLBACK_CASES:
             self.fallback.resolve(trigger, vector)
             
             self._check(
@@ -593,11 +934,11 @@ class SpiralTestbench:
                 expected_addr
             )
             
-            self._record_vcd(
-                trigger_fallback=int(trigger),
-                fallback_vector=vector,
-                rpp_fallback_address=self.fallback.rpp_fallback_address
-            )
+            self.vcd.change_many((
+                (self.h_trigger_fallback, int(trigger)),
+                (self.h_fallback_vector, vector),
+                (self.h_rpp_fallback_address, self.fallback.rpp_fallback_address),
+            ))
             self._clock_cycle()
             
             self._record_coverage("fallback_xor")
@@ -626,6 +967,8 @@ class SpiralTestbench:
             )
             self._clock_cycle()
             self._record_coverage("pma_ram")
+        
+        self.pma_ram.dump_vcd(self.vcd)
     
     def test_integration_scenarios(self):
         """Test 6: Integration scenarios."""
@@ -642,23 +985,26 @@ class SpiralTestbench:
             (False, True, ConsentState.SUSPENDED_CONSENT, "Suspended + fallback"),
             (True, True, ConsentState.EMERGENCY_OVERRIDE, "Emergency override"),
         ]
+        # Resolve each consent state to its int code and name up front
+        scenarios = [(coh_valid, scalar_trig, int(consent), consent.name, desc)
+                     for coh_valid, scalar_trig, consent, desc in scenarios]
         
-        for coh_valid, scalar_trig, consent, desc in scenarios:
+        for coh_valid, scalar_trig, consent, consent_name, desc in scenarios:
             self._log(f"\n  Scenario: {desc}")
             
             # Determine expected behavior
             should_fallback = not coh_valid
-            should_route = coh_valid and consent == ConsentState.FULL_CONSENT
+            should_route = coh_valid and consent == _FULL_CONSENT
             
             self._log(f"    coherence_valid={coh_valid}, scalar_triggered={scalar_trig}")
-            self._log(f"    consent_state={consent.name}")
+            self._log(f"    consent_state={consent_name}")
             self._log(f"    -> should_fallback={should_fallback}, should_route={should_route}")
             
             # Record state
             self._record_vcd(
                 coherence_valid=int(coh_valid),
                 scalar_triggered=int(scalar_trig),
-                consent_state=consent.value,
+                consent_state=consent,
                 trigger_fallback=int(should_fallback)
             )
             self._clock_cycle()
@@ -669,31 +1015,34 @@ class SpiralTestbench:
     # Run All Tests
     # =========================================================================
     
-    def run_all(self) -> Tuple[int, int, int]:
-        """Run all tests and generate reports."""
-        self._log("=" * 60)
-        self._log("SPIRAL Protocol HDL Simulation")
-        self._log("=" * 60)
-        self._log(f"Start time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        # Start VCD
+    # Test methods in run order. Each one drives its own models and only
+    # shares the counters and the VCD stream, so they can also run apart.
+    TESTS = (
+        "test_consent_header_edge_cases",
+        "test_coherence_evaluator_sweep",
+        "test_scalar_trigger_timing",
+        "test_fallback_resolver",
+        "test_pma_ram",
+        "test_integration_scenarios",
+    )
+    
+    def _start_vcd(self):
+        """Open the VCD and drive the reset sequence."""
         self.vcd.begin()
         self._record_vcd(clk=0, reset=1, enable=0)
         self._clock_cycle()
         self._record_vcd(reset=0, enable=1)
         self._clock_cycle()
-        
-        # Run tests
-        self.test_consent_header_edge_cases()
-        self.test_coherence_evaluator_sweep()
-        self.test_scalar_trigger_timing()
-        self.test_fallback_resolver()
-        self.test_pma_ram()
-        self.test_integration_scenarios()
-        
-        # End VCD
-        self.vcd.end()
-        
+    
+    def _log_banner(self):
+        """Log the run header."""
+        self._log("=" * 60)
+        self._log("SPIRAL Protocol HDL Simulation")
+        self._log("=" * 60)
+        self._log(f"Start time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    def _report(self, waveforms: Sequence[str]):
+        """Log the summary and coverage report, then save the trace log."""
         # Print summary
         self._log("\n" + "=" * 60)
         self._log("TEST SUMMARY")
@@ -716,11 +1065,80 @@ class SpiralTestbench:
         # Save trace log
         log_filename = "spiral_sim_trace.log"
         with open(log_filename, 'w') as f:
-            f.write('\n'.join(self.trace_log))
+            f.write(self.trace_log.getvalue())
         self._log(f"\nTrace log saved to: {log_filename}")
-        self._log(f"Waveform saved to: {self.vcd.filename}")
+        for waveform in waveforms:
+            self._log(f"Waveform saved to: {waveform}")
+        sys.stdout.flush()
+    
+    def run_all(self) -> Tuple[int, int, int]:
+        """Run all tests and generate reports."""
+        self._log_banner()
+        
+        # Start VCD
+        self._start_vcd()
+        
+        # Run tests
+        for name in self.TESTS:
+            getattr(self, name)()
+            self._flush_coverage()
+        
+        # End VCD
+        self.vcd.end()
+        
+        self._report([self.vcd.filename])
         
         return self.test_count, self.pass_count, self.fail_count
+    
+    def run_isolated(self, test_name: str) -> Tuple[int, int, int, Dict[str, int], str]:
+        """
+        Run one test method against this testbench's own VCD.
+        
+        Returns (tests, passed, failed, coverage, trace) for merging by
+        run_all_parallel().
+        """
+        self._start_vcd()
+        getattr(self, test_name)()
+        self._flush_coverage()
+        self.vcd.end()
+        return (self.test_count, self.pass_count, self.fail_count,
+                dict(self.coverage), self.trace_log.getvalue())
+
+
+def _run_isolated_test(test_name: str, vcd_filename: str) -> Tuple[int, int, int, Dict[str, int], str]:
+    """Worker entry point: run one test in a fresh testbench, trace kept off stdout."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return SpiralTestbench(vcd_filename).run_isolated(test_name)
+
+
+def run_all_parallel(vcd_prefix: str = "spiral_sim",
+                     max_workers: Optional[int] = None) -> Tuple[int, int, int]:
+    """
+    Run every SpiralTestbench test in its own worker process.
+    
+    Each test gets a fresh testbench and writes its own
+    <vcd_prefix>_<test>.vcd, starting from time 0. Counters and coverage
+    are merged, and the per-test traces are echoed and saved in TESTS
+    order.
+    """
+    tb = SpiralTestbench(f"{vcd_prefix}.vcd")
+    tb._log_banner()
+    
+    waveforms = [f"{vcd_prefix}_{name}.vcd" for name in SpiralTestbench.TESTS]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_run_isolated_test, SpiralTestbench.TESTS, waveforms))
+    
+    for tests, passed, failed, coverage, trace in results:
+        tb.test_count += tests
+        tb.pass_count += passed
+        tb.fail_count += failed
+        tb.coverage.update(coverage)
+        tb.trace_log.write(trace)
+        sys.stdout.write(trace)
+    
+    tb._report(waveforms)
+    
+    return tb.test_count, tb.pass_count, tb.fail_count
 
 
 # =============================================================================
@@ -732,9 +1150,16 @@ if __name__ == "__main__":
     output_dir = r"C:\Users\schmi\Documents\GitHub\rpp-spec\hardware\verilog"
     os.chdir(output_dir)
     
-    # Run simulation
-    tb = SpiralTestbench("spiral_sim.vcd")
-    total, passed, failed = tb.run_all()
+    # The trace echo is one line per check; let stdout buffer it in blocks
+    # rather than flushing every line on a terminal
+    sys.stdout.reconfigure(line_buffering=False)
+    
+    # Run simulation (--parallel: one worker process and VCD per test)
+    if "--parallel" in sys.argv[1:]:
+        total, passed, failed = run_all_parallel("spiral_sim")
+    else:
+        tb = SpiralTestbench("spiral_sim.vcd")
+        total, passed, failed = tb.run_all()
     
     # Exit code
     sys.exit(0 if failed == 0 else 1)
@@ -18,10 +18,13 @@ Run: python hdl_simulation_ra.py
 View waveforms: gtkwave spiral_ra_sim.vcd
 """
 
+import ctypes
 import os
+import struct
 import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Callable, ClassVar
+from array import array
 from enum import IntEnum
 import time
 import json
@@ -30,6 +33,11 @@ import json
 GREEN_PHI = 1.618033988749895
 ANKH = 5.08897958067581  # GREEN_PHI ** 3
 
+# Byte-aligned view of the 18-byte consent header: rpp_address, packet_id,
+# origin_ref, consent, entropy, payload, fallback, window_id, phase_ref, crc
+HEADER_STRUCT = struct.Struct(">IIHBBBBHBB")
+HEADER_MASK = (1 << 144) - 1
+
 # =============================================================================
 # VCD Waveform Writer
 # =============================================================================
@@ -117,11 +125,155 @@ class RoutingDecision(IntEnum):
     ROUTE_EMERGENCY = 4
 
 
+# Enum members bound once for the models' hot paths: attribute lookups on
+# an Enum class cost several times a module global load
+(_FULL_CONSENT, _DIMINISHED_CONSENT, _SUSPENDED_CONSENT,
+ _EMERGENCY_OVERRIDE) = ConsentState
+(_ROUTE_NORMAL, _ROUTE_FALLBACK, _ROUTE_PMA, _ROUTE_BLOCKED,
+ _ROUTE_EMERGENCY) = RoutingDecision
+
+
 # =============================================================================
 # HDL Module Behavioral Models
 # =============================================================================
 
-@dataclass
+# Slotted dataclasses where supported (Python 3.10+): fixed attribute
+# storage instead of a per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# ConsentState for the top five bits of the consent byte, (verbal << 4) |
+# somatic: SUSPENDED below somatic 3 (< 0.2), DIMINISHED below 8 (< 0.5)
+# without verbal consent, FULL otherwise
+_CONSENT_STATES: Tuple[ConsentState, ...] = tuple(
+    ConsentState.SUSPENDED_CONSENT if somatic < 3 else
+    ConsentState.DIMINISHED_CONSENT if somatic < 8 and not verbal else
+    ConsentState.FULL_CONSENT
+    for verbal in (0, 1) for somatic in range(16))
+
+
+def _byte_table(fn: Callable[[int], int]) -> bytes:
+    """bytes.translate() table applying fn to every byte value."""
+    return bytes(fn(b) for b in range(256))
+
+
+# Per-byte field extraction for ConsentHeaderParser.parse_batch()
+_TABLE_HI5 = _byte_table(lambda b: b >> 3)            # theta, entropy
+_TABLE_LO3 = _byte_table(lambda b: b & 0x07)          # phi, complecount
+_TABLE_HI3 = _byte_table(lambda b: b >> 5)            # omega, radius low bits
+_TABLE_RADIUS_HI = _byte_table(lambda b: (b & 0x1F) << 3)
+_TABLE_VERBAL = _byte_table(lambda b: b >> 7)
+_TABLE_SOMATIC = _byte_table(lambda b: (b >> 3) & 0x0F)
+_TABLE_ANCESTRAL = _byte_table(lambda b: (b >> 1) & 0x03)
+_TABLE_LO1 = _byte_table(lambda b: b & 0x01)
+_TABLE_LO4 = _byte_table(lambda b: b & 0x0F)
+_TABLE_NONZERO = _byte_table(lambda b: int(b != 0))
+_TABLE_ZERO = _byte_table(lambda b: int(b == 0))
+_TABLE_NEEDS_FALLBACK = _byte_table(lambda b: int((b >> 3) > 25))
+_TABLE_CONSENT_STATE = _byte_table(lambda b: _CONSENT_STATES[b >> 3])
+
+
+class HeaderRecord(ctypes.BigEndianStructure):
+    """
+    Packed 18-byte consent header with one attribute per field.
+
+    Same layout as the wire format, so an array of records is a zero-copy
+    view of a header stream (see header_records()).
+    """
+    _pack_ = 1
+    _fields_ = [
+        ("rpp_theta", ctypes.c_uint32, 5),
+        ("rpp_phi", ctypes.c_uint32, 3),
+        ("rpp_omega", ctypes.c_uint32, 3),
+        ("rpp_radius", ctypes.c_uint32, 8),
+        ("rpp_reserved", ctypes.c_uint32, 13),
+        ("packet_id", ctypes.c_uint32),
+        ("origin_ref", ctypes.c_uint16),
+        ("consent_verbal", ctypes.c_uint8, 1),
+        ("consent_somatic", ctypes.c_uint8, 4),
+        ("consent_ancestral", ctypes.c_uint8, 2),
+        ("temporal_lock", ctypes.c_uint8, 1),
+        ("phase_entropy_index", ctypes.c_uint8, 5),
+        ("complecount_trace", ctypes.c_uint8, 3),
+        ("payload_reserved", ctypes.c_uint8, 4),
+        ("payload_type", ctypes.c_uint8, 4),
+        ("fallback_vector", ctypes.c_uint8),
+        ("coherence_window_id", ctypes.c_uint16),
+        ("target_phase_ref", ctypes.c_uint8),
+        ("header_crc", ctypes.c_uint8),
+    ]
+
+
+def header_records(buf: bytes) -> ctypes.Array:
+    """
+    View back-to-back headers as a HeaderRecord array.
+
+    Writable buffers (bytearray, array) are shared rather than copied;
+    read-only ones such as bytes are copied once. Trailing bytes short of
+    a full header are ignored.
+    """
+    array_type = HeaderRecord * (len(buf) // ctypes.sizeof(HeaderRecord))
+    try:
+        return array_type.from_buffer(buf)
+    except TypeError:
+        return array_type.from_buffer_copy(buf)
+
+
+def _be_column(data: bytes, offset: int, width: int, typecode: str) -> array:
+    """Big-endian field of width bytes at offset in every header of data."""
+    size = HEADER_STRUCT.size
+    raw = bytearray(len(data) // size * width)
+    for i in range(width):
+        raw[i::width] = data[offset + i::size]
+    column = array(typecode, raw)
+    if sys.byteorder == "little":
+        column.byteswap()
+    return column
+
+
+def _crc8_entry(byte: int) -> int:
+    """Bit-serial CRC-8/CCITT (polynomial 0x07) of a single byte."""
+    crc = byte
+    for _ in range(8):
+        crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+    return crc
+
+
+# CRC-8/CCITT lookup: one table step replaces eight shift/XOR steps
+_CRC8_TABLE = bytes(_crc8_entry(byte) for byte in range(256))
+
+
+def compute_header_crc(buf: bytes, offset: int = 0) -> int:
+    """CRC-8/CCITT over bytes 0-16 of the header at offset in buf."""
+    table = _CRC8_TABLE
+    crc = 0
+    for byte in buf[offset:offset + 17]:
+        crc = table[crc ^ byte]
+    return crc
+
+
+def verify_crc_batch(buf: bytes) -> array:
+    """
+    Check header_crc of back-to-back 18-byte headers, one flag per header.
+
+    The CRC runs over every header at once: each step XORs the running
+    CRC column with the next byte column (as one big int) and maps the
+    result through _CRC8_TABLE with bytes.translate().
+    """
+    data = buf if type(buf) is bytes else bytes(buf)
+    size = HEADER_STRUCT.size
+    count, partial = divmod(len(data), size)
+    if partial:
+        raise struct.error(f"verify_crc_batch requires a multiple of {size} bytes")
+
+    crc = 0
+    for offset in range(17):
+        crc ^= int.from_bytes(data[offset::size], "big")
+        crc = int.from_bytes(crc.to_bytes(count, "big").translate(_CRC8_TABLE), "big")
+    crc ^= int.from_bytes(data[17::size], "big")
+    return array('B', crc.to_bytes(count, "big").translate(_TABLE_ZERO))
+
+
+@dataclass(**_SLOTS)
 class ConsentHeaderParser:
     """
     Behavioral model of ConsentHeaderParser (spec-compliant).
@@ -173,54 +325,144 @@ class ConsentHeaderParser:
     has_pma_link: bool = False
 
     def parse(self, header: int) -> None:
-        """Parse 144-bit header (big-endian)."""
-        # Extract bytes
-        bytes_list = [(header >> (8 * (17 - i))) & 0xFF for i in range(18)]
+        """Parse 144-bit header (big-endian). Bits above 143 are ignored."""
+        # Serialize in one step; only out-of-range headers pay for the mask
+        try:
+            buf = header.to_bytes(18, "big")
+        except OverflowError:
+            buf = (header & HEADER_MASK).to_bytes(18, "big")
+        self.parse_bytes(buf)
+
+    def parse_bytes(self, buf: bytes, offset: int = 0) -> None:
+        """
+        Parse an 18-byte header from buf at offset (HEADER_STRUCT layout).
+
+        buf may be any buffer (bytes, bytearray, memoryview, HeaderRecord)
+        and is read in place; to walk a stream of headers, advance offset
+        by HEADER_STRUCT.size instead of slicing buf.
+        """
+        # Bytes 10-17 are unpacked per byte rather than as one 64-bit word:
+        # shifting a word above 2**62 works on a multi-digit int in CPython,
+        # which made the single-word (SWAR) decode the slower of the two.
+        (rpp_addr, self.packet_id, self.origin_ref, consent, entropy, payload,
+         self.fallback_vector, self.coherence_window_id, self.target_phase_ref,
+         self.header_crc) = HEADER_STRUCT.unpack_from(buf, offset)
 
         # RPP Address (bytes 0-3)
-        rpp_addr = (bytes_list[0] << 24) | (bytes_list[1] << 16) | (bytes_list[2] << 8) | bytes_list[3]
         self.rpp_theta = (rpp_addr >> 27) & 0x1F
         self.rpp_phi = (rpp_addr >> 24) & 0x07
         self.rpp_omega = (rpp_addr >> 21) & 0x07
         self.rpp_radius = (rpp_addr >> 13) & 0xFF
 
-        # Identification
-        self.packet_id = (bytes_list[4] << 24) | (bytes_list[5] << 16) | (bytes_list[6] << 8) | bytes_list[7]
-        self.origin_ref = (bytes_list[8] << 8) | bytes_list[9]
-
         # Consent (byte 10)
-        self.consent_verbal = bool(bytes_list[10] >> 7)
-        self.consent_somatic = (bytes_list[10] >> 3) & 0x0F
-        self.consent_ancestral = (bytes_list[10] >> 1) & 0x03
-        self.temporal_lock = bool(bytes_list[10] & 0x01)
+        self.consent_verbal = bool(consent >> 7)
+        self.consent_somatic = (consent >> 3) & 0x0F
+        self.consent_ancestral = (consent >> 1) & 0x03
+        self.temporal_lock = bool(consent & 0x01)
 
         # Entropy (byte 11)
-        self.phase_entropy_index = (bytes_list[11] >> 3) & 0x1F
-        self.complecount_trace = bytes_list[11] & 0x07
+        self.phase_entropy_index = (entropy >> 3) & 0x1F
+        self.complecount_trace = entropy & 0x07
 
         # Payload (byte 12)
-        self.payload_type = bytes_list[12] & 0x0F
-
-        # Routing
-        self.fallback_vector = bytes_list[13]
-        self.coherence_window_id = (bytes_list[14] << 8) | bytes_list[15]
-        self.target_phase_ref = bytes_list[16]
-        self.header_crc = bytes_list[17]
-
-        # Derive consent state
-        if self.consent_somatic < 3:  # < 0.2
-            self.consent_state = ConsentState.SUSPENDED_CONSENT
-        elif self.consent_somatic < 8 and not self.consent_verbal:  # < 0.5
-            self.consent_state = ConsentState.DIMINISHED_CONSENT
-        else:
-            self.consent_state = ConsentState.FULL_CONSENT
+        self.payload_type = payload & 0x0F
+
+        # Derive consent state from verbal and somatic (consent bits 7:3)
+        self.consent_state = _CONSENT_STATES[consent >> 3]
 
         # Derived flags
         self.needs_fallback = self.phase_entropy_index > 25
         self.has_pma_link = self.coherence_window_id != 0
 
-
-@dataclass
+    @classmethod
+    def from_record(cls, record: HeaderRecord) -> "ConsentHeaderParser":
+        """Parser holding the fields of one HeaderRecord."""
+        parser = cls()
+        parser.parse_bytes(record)
+        return parser
+
+    def parse_batch(self, buf: bytes) -> Dict[str, array]:
+        """
+        Parse back-to-back 18-byte headers into one array column per field.
+
+        Works a column at a time rather than a header at a time: each
+        header byte is sliced out of buf as a strided column, sub-byte
+        fields are extracted with bytes.translate() tables and multi-byte
+        fields are reassembled from their byte columns, so there is no
+        Python-level loop over headers. consent_state holds ConsentState
+        values. The outputs are left holding the last header.
+        """
+        # Strided slices of bytes run as a tight C copy loop, several times
+        # faster than slicing a memoryview, so other buffers are copied once
+        data = buf if type(buf) is bytes else bytes(buf)
+        size = HEADER_STRUCT.size
+        count, partial = divmod(len(data), size)
+        if partial:
+            raise struct.error(f"parse_batch requires a multiple of {size} bytes")
+
+        def column(offset: int) -> bytes:
+            return data[offset::size]
+
+        def merge(high: bytes, low: bytes) -> bytes:
+            # Bytewise OR of two equal-length columns
+            return (int.from_bytes(high, "big")
+                    | int.from_bytes(low, "big")).to_bytes(count, "big")
+
+        rpp0, rpp1, rpp2 = column(0), column(1), column(2)
+        consent, entropy = column(10), column(11)
+        columns = {
+            "rpp_theta": array('B', rpp0.translate(_TABLE_HI5)),
+            "rpp_phi": array('B', rpp0.translate(_TABLE_LO3)),
+            "rpp_omega": array('B', rpp1.translate(_TABLE_HI3)),
+            "rpp_radius": array('B', merge(rpp1.translate(_TABLE_RADIUS_HI),
+                                           rpp2.translate(_TABLE_HI3))),
+            "packet_id": _be_column(data, 4, 4, 'I'),
+            "origin_ref": _be_column(data, 8, 2, 'H'),
+            "consent_verbal": array('B', consent.translate(_TABLE_VERBAL)),
+            "consent_somatic": array('B', consent.translate(_TABLE_SOMATIC)),
+            "consent_ancestral": array('B', consent.translate(_TABLE_ANCESTRAL)),
+            "temporal_lock": array('B', consent.translate(_TABLE_LO1)),
+            "phase_entropy_index": array('B', entropy.translate(_TABLE_HI5)),
+            "complecount_trace": array('B', entropy.translate(_TABLE_LO3)),
+            "payload_type": array('B', column(12).translate(_TABLE_LO4)),
+            "fallback_vector": array('B', column(13)),
+            "coherence_window_id": _be_column(data, 14, 2, 'H'),
+            "target_phase_ref": array('B', column(16)),
+            "header_crc": array('B', column(17)),
+            "consent_state": array('B', consent.translate(_TABLE_CONSENT_STATE)),
+            "needs_fallback": array('B', entropy.translate(_TABLE_NEEDS_FALLBACK)),
+            "has_pma_link": array('B', merge(column(14), column(15))
+                                  .translate(_TABLE_NONZERO)),
+        }
+        if count:
+            self.parse_bytes(data, len(data) - size)
+        return columns
+
+
+def _ra_coherence(phase_entropy_index: int, complecount_trace: int) -> float:
+    """Ra coherence formula, (phi x E) + (ANKH_SYMBOL x C)."""
+    E = phase_entropy_index / 31.0 if phase_entropy_index <= 31 else 1.0
+    C = complecount_trace / 7.0 if complecount_trace <= 7 else 1.0
+    return (GREEN_PHI * E) + (ANKH * C)
+
+
+# (score, score_x100) for every in-range input, indexed (entropy << 3) | comple.
+# Entries come from _ra_coherence itself, so they are bit-identical to
+# evaluating the formula.
+_RA_SCORE_TABLE: Tuple[Tuple[float, int], ...] = tuple(
+    (score, int(score * 100))
+    for score in (_ra_coherence(e, c) for e in range(32) for c in range(8)))
+
+# Column views of the same table for evaluate_batch(), plus its H/M/L flags
+# as bytes.translate() tables
+_RA_SCORES: Tuple[float, ...] = tuple(score for score, _ in _RA_SCORE_TABLE)
+_RA_SCORES_X100: Tuple[int, ...] = tuple(x100 for _, x100 in _RA_SCORE_TABLE)
+_RA_HIGH = bytes(score >= 5.0 for score in _RA_SCORES)
+_RA_MEDIUM = bytes(3.0 <= score < 5.0 for score in _RA_SCORES)
+_RA_LOW = bytes(score < 3.0 for score in _RA_SCORES)
+
+
+@dataclass(**_SLOTS)
 class CoherenceEvaluator_Ra:
     """
     Behavioral model of CoherenceEvaluator_Ra.
@@ -240,26 +482,90 @@ class CoherenceEvaluator_Ra:
     low_coherence: bool = False
 
     def evaluate(self, phase_entropy_index: int, complecount_trace: int,
-                 threshold: float = 3.0) -> None:
-        """Evaluate coherence using Ra formula."""
-        # Normalize inputs
-        E = phase_entropy_index / 31.0 if phase_entropy_index <= 31 else 1.0
-        C = complecount_trace / 7.0 if complecount_trace <= 7 else 1.0
-
-        # Ra formula
-        self.coherence_score = (GREEN_PHI * E) + (ANKH * C)
-        self.coherence_score_x100 = int(self.coherence_score * 100)
+                 threshold: float = 3.0, *, int_only: bool = False) -> None:
+        """
+        Evaluate coherence using Ra formula.
+
+        With int_only, only the outputs the trigger/arbitration path reads
+        (coherence_score_x100 and coherence_valid) are updated;
+        coherence_score and the classification flags keep their values.
+        """
+        # Ra formula, tabulated for the 5-bit entropy / 3-bit complecount
+        # range; any other input (including non-int) takes the formula
+        if (type(phase_entropy_index) is int and type(complecount_trace) is int
+                and 0 <= phase_entropy_index <= 31 and 0 <= complecount_trace <= 7):
+            score, score_x100 = _RA_SCORE_TABLE[(phase_entropy_index << 3)
+                                                | complecount_trace]
+        else:
+            score = _ra_coherence(phase_entropy_index, complecount_trace)
+            score_x100 = int(score * 100)
+        self.coherence_score_x100 = score_x100
 
         # Threshold comparison
-        self.coherence_valid = self.coherence_score >= threshold
+        self.coherence_valid = score >= threshold
+        if int_only:
+            return
+        self.coherence_score = score
 
         # Classification
-        self.high_coherence = self.coherence_score >= 5.0
-        self.medium_coherence = 3.0 <= self.coherence_score < 5.0
-        self.low_coherence = self.coherence_score < 3.0
-
-
-@dataclass
+        self.high_coherence = score >= 5.0
+        self.medium_coherence = 3.0 <= score < 5.0
+        self.low_coherence = score < 3.0
+
+    def evaluate_batch(self, phase_entropy_indices: List[int],
+                       complecount_traces: List[int],
+                       threshold: float = 3.0) -> Dict[str, array]:
+        """
+        evaluate() over paired input columns, one array per output field.
+
+        When every input is in range, each sample is reduced to its
+        _RA_SCORE_TABLE index once and the outputs are gathered from the
+        table columns, the flags by bytes.translate() in C. Otherwise the
+        formula runs per sample. The outputs are left holding the last
+        sample. The two columns must be the same length.
+        """
+        entropies = phase_entropy_indices
+        comples = complecount_traces
+        if len(entropies) != len(comples):
+            raise ValueError(f"evaluate_batch: {len(entropies)} entropy indices "
+                             f"but {len(comples)} complecount traces")
+        index = None
+        # max() rejects inputs that do not compare, bytes() any entropy
+        # outside 0-31 or negative complecount, and the shift any non-int
+        # input; all of those take the formula
+        try:
+            if entropies and max(comples) <= 7:
+                index = bytes([(e << 3) | c for e, c in zip(entropies, comples)])
+        except (TypeError, ValueError):
+            pass
+        if index is not None:
+            scores = _RA_SCORES
+            scores_x100 = _RA_SCORES_X100
+            valid = bytes([score >= threshold for score in scores])
+            columns = {
+                "coherence_score": array('d', [scores[i] for i in index]),
+                "coherence_score_x100": array('i', [scores_x100[i] for i in index]),
+                "coherence_valid": array('B', index.translate(valid)),
+                "high_coherence": array('B', index.translate(_RA_HIGH)),
+                "medium_coherence": array('B', index.translate(_RA_MEDIUM)),
+                "low_coherence": array('B', index.translate(_RA_LOW)),
+            }
+        else:
+            scores = [_ra_coherence(e, c) for e, c in zip(entropies, comples)]
+            columns = {
+                "coherence_score": array('d', scores),
+                "coherence_score_x100": array('i', [int(s * 100) for s in scores]),
+                "coherence_valid": array('B', [s >= threshold for s in scores]),
+                "high_coherence": array('B', [s >= 5.0 for s in scores]),
+                "medium_coherence": array('B', [3.0 <= s < 5.0 for s in scores]),
+                "low_coherence": array('B', [s < 3.0 for s in scores]),
+            }
+        if entropies:
+            self.evaluate(entropies[-1], comples[-1], threshold)
+        return columns
+
+
+@dataclass(**_SLOTS)
 class ScalarTrigger_Ra:
     """
     Behavioral model of ScalarTrigger_Ra.
@@ -287,6 +593,9 @@ class ScalarTrigger_Ra:
             self.stable_resonance = False
             return
 
+        # Compare-and-increment stays: min(counter + 1, limit) is several
+        # times slower in CPython, and scalar_triggered must lag the counter
+        # reaching coherence_duration by one cycle
         if self.above_threshold:
             if self.coherence_counter < coherence_duration:
                 self.coherence_counter += 1
@@ -300,7 +609,7 @@ class ScalarTrigger_Ra:
         self.stable_resonance = self.scalar_triggered and coherence_valid
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScalarTrigger_Ra_Khat:
     """
     Behavioral model of ScalarTrigger_Ra_Khat.
@@ -308,7 +617,7 @@ class ScalarTrigger_Ra_Khat:
     KHAT-fixed 12-cycle duration scalar trigger.
     KHAT = sqrt(10) ~ 3.162 -> scaled 316 -> 316 mod 16 = 12 cycles
     """
-    KHAT_DURATION: int = 12  # Fixed duration
+    KHAT_DURATION: ClassVar[int] = 12  # Fixed duration
 
     coherence_counter: int = 0
     scalar_triggered: bool = False
@@ -338,7 +647,7 @@ class ScalarTrigger_Ra_Khat:
             self.scalar_triggered = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ConsentStateDeriver:
     """
     Behavioral model of ConsentStateDeriver.
@@ -348,22 +657,22 @@ class ConsentStateDeriver:
     - somatic 6-9 -> DIMINISHED_CONSENT (1-phi ~ 0.382)
     - somatic 0-5 -> SUSPENDED_CONSENT (phi^2 boundary)
     """
-    SOMATIC_FULL_THRESHOLD: int = 10  # phi ~ 0.618 -> ceil(0.618*16)
-    SOMATIC_DIM_MIN: int = 6          # 1-phi ~ 0.382 -> floor(0.382*16)
+    SOMATIC_FULL_THRESHOLD: ClassVar[int] = 10  # phi ~ 0.618 -> ceil(0.618*16)
+    SOMATIC_DIM_MIN: ClassVar[int] = 6          # 1-phi ~ 0.382 -> floor(0.382*16)
 
     def derive(self, somatic_coherence: int, verbal_override: bool) -> ConsentState:
         """Derive consent state from somatic coherence."""
         if verbal_override:
-            return ConsentState.FULL_CONSENT
+            return _FULL_CONSENT
         elif somatic_coherence >= self.SOMATIC_FULL_THRESHOLD:
-            return ConsentState.FULL_CONSENT
+            return _FULL_CONSENT
         elif somatic_coherence >= self.SOMATIC_DIM_MIN:
-            return ConsentState.DIMINISHED_CONSENT
+            return _DIMINISHED_CONSENT
         else:
-            return ConsentState.SUSPENDED_CONSENT
+            return _SUSPENDED_CONSENT
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ETFController:
     """
     Behavioral model of ETFController (Emergency Token Freeze).
@@ -372,8 +681,8 @@ class ETFController:
     - ETF_DURATION = 137 mod 16 = 9 cycles
     - ETF_RELEASE_THRESHOLD = 674 * (137/165) ~ 559
     """
-    ETF_DURATION: int = 9             # 137 mod 16
-    ETF_RELEASE_THRESHOLD: int = 559  # 674 * (137/165)
+    ETF_DURATION: ClassVar[int] = 9             # 137 mod 16
+    ETF_RELEASE_THRESHOLD: ClassVar[int] = 559  # 674 * (137/165)
 
     etf_active: bool = False
     etf_counter: int = 0
@@ -396,7 +705,7 @@ class ETFController:
                 self.etf_active = False  # Mirror check passed
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FallbackResolver_Ra:
     """
     Behavioral model of FallbackResolver_Ra.
@@ -426,7 +735,9 @@ class FallbackResolver_Ra:
             phi_off = (fallback_vector >> 2) & 0x07
             omega_off = fallback_vector & 0x03
 
-            # XOR and wrap
+            # XOR and wrap. Byte-table wraps were measured here and came out
+            # no faster: the compares are cheap next to the call and the
+            # attribute stores, and a table also needs an input range guard.
             theta_xor = primary_theta ^ theta_off
             if theta_xor > 27:
                 theta_xor -= 27
@@ -455,7 +766,50 @@ class FallbackResolver_Ra:
         )
 
 
-@dataclass
+def _arbitration_entry(index: int) -> Tuple[bool, bool, bool, RoutingDecision]:
+    """
+    Arbitration outputs for (consent_state << 3) | (pma_hit << 2) |
+    (needs_fallback << 1) | coherence_valid.
+    """
+    consent_state = ConsentState(index >> 3)
+    pma_hit = bool(index & 4)
+    needs_fallback = bool(index & 2)
+    coherence_valid = bool(index & 1)
+
+    is_suspended = consent_state == _SUSPENDED_CONSENT
+    is_emergency = consent_state == _EMERGENCY_OVERRIDE
+
+    consent_allows = (
+        consent_state == _FULL_CONSENT or
+        (consent_state == _DIMINISHED_CONSENT and coherence_valid)
+    )
+
+    route_allowed = consent_allows and not is_suspended and not is_emergency
+    use_fallback = needs_fallback and not coherence_valid and route_allowed
+    use_pma_route = pma_hit and coherence_valid and route_allowed
+
+    if is_emergency:
+        routing_decision = _ROUTE_EMERGENCY
+    elif is_suspended:
+        routing_decision = _ROUTE_BLOCKED
+    elif use_pma_route:
+        routing_decision = _ROUTE_PMA
+    elif use_fallback:
+        routing_decision = _ROUTE_FALLBACK
+    elif route_allowed:
+        routing_decision = _ROUTE_NORMAL
+    else:
+        routing_decision = _ROUTE_BLOCKED
+    return route_allowed, use_fallback, use_pma_route, routing_decision
+
+
+# (route_allowed, use_fallback, use_pma_route, routing_decision) for every
+# arbitration input; scalar_triggered does not take part in the decision
+_ARBITRATION_TABLE = tuple(_arbitration_entry(i) for i in range(32))
+_ROUTE_TABLE = tuple(entry[3] for entry in _ARBITRATION_TABLE)
+
+
+@dataclass(**_SLOTS)
 class ConsentArbitrator_Ra:
     """
     Behavioral model of ConsentArbitrator_Ra.
@@ -471,35 +825,123 @@ class ConsentArbitrator_Ra:
                   consent_state: ConsentState, needs_fallback: bool,
                   pma_hit: bool) -> None:
         """Determine routing decision."""
-        is_suspended = consent_state == ConsentState.SUSPENDED_CONSENT
-        is_emergency = consent_state == ConsentState.EMERGENCY_OVERRIDE
+        (self.route_allowed, self.use_fallback, self.use_pma_route,
+         self.routing_decision) = _ARBITRATION_TABLE[
+            (consent_state << 3) | ((1 if pma_hit else 0) << 2)
+            | ((1 if needs_fallback else 0) << 1) | (1 if coherence_valid else 0)]
 
-        consent_allows = (
-            consent_state == ConsentState.FULL_CONSENT or
-            (consent_state == ConsentState.DIMINISHED_CONSENT and coherence_valid)
-        )
 
-        self.route_allowed = consent_allows and not is_suspended and not is_emergency
-        self.use_fallback = needs_fallback and not coherence_valid and self.route_allowed
-        self.use_pma_route = pma_hit and coherence_valid and self.route_allowed
-
-        if is_emergency:
-            self.routing_decision = RoutingDecision.ROUTE_EMERGENCY
-        elif is_suspended:
-            self.routing_decision = RoutingDecision.ROUTE_BLOCKED
-        elif self.use_pma_route:
-            self.routing_decision = RoutingDecision.ROUTE_PMA
-        elif self.use_fallback:
-            self.routing_decision = RoutingDecision.ROUTE_FALLBACK
-        elif self.route_allowed:
-            self.routing_decision = RoutingDecision.ROUTE_NORMAL
-        else:
-            self.routing_decision = RoutingDecision.ROUTE_BLOCKED
+# Pipeline state carried between pipeline_decide() calls:
+# (khat_counter, khat_triggered, etf_active, etf_counter)
+PIPELINE_RESET_STATE: Tuple[int, bool, bool, int] = (0, False, False, 0)
+
+
+def _khat_etf_step(enable: bool, coherence_score: int,
+                   activation_threshold: int, etf_trigger: bool,
+                   state: Tuple[int, bool, bool, int]
+                   ) -> Tuple[int, bool, bool, int]:
+    """
+    One clock of ScalarTrigger_Ra_Khat and ETFController on a
+    pipeline_decide() state tuple, returning the next state.
+    """
+    khat_counter, khat_triggered, etf_active, etf_counter = state
+
+    # KHAT scalar trigger
+    if not enable:
+        khat_triggered = False
+    elif coherence_score >= activation_threshold:
+        if khat_counter < 15:
+            khat_counter += 1
+        if khat_counter >= ScalarTrigger_Ra_Khat.KHAT_DURATION:
+            khat_triggered = True
+    else:
+        khat_counter = 0
+        khat_triggered = False
+
+    # Emergency token freeze
+    if etf_trigger and not etf_active:
+        etf_active = True
+        etf_counter = ETFController.ETF_DURATION
+    elif etf_active:
+        if etf_counter > 0:
+            etf_counter -= 1
+        elif coherence_score >= ETFController.ETF_RELEASE_THRESHOLD:
+            etf_active = False
+
+    return khat_counter, khat_triggered, etf_active, etf_counter
+
+
+def pipeline_decide(phase_entropy_index: int, complecount_trace: int,
+                    threshold: float, khat_enable: bool, khat_threshold: int,
+                    etf_trigger: bool, consent_state: ConsentState,
+                    needs_fallback: bool, pma_hit: bool,
+                    state: Tuple[int, bool, bool, int]
+                    ) -> Tuple[RoutingDecision, Tuple[int, bool, bool, int]]:
+    """
+    One clock of the evaluate -> KHAT trigger -> ETF -> arbitrate path.
+
+    Equivalent to CoherenceEvaluator_Ra.evaluate(), then
+    ScalarTrigger_Ra_Khat.clock() and ETFController.clock() on the x100
+    score, then ConsentArbitrator_Ra.arbitrate(), but on locals and the
+    clock_bulk() KHAT/ETF step, with the trigger/ETF registers passed in
+    and out as a state tuple. Returns (routing_decision, next_state).
+    """
+    # Ra coherence formula
+    if (type(phase_entropy_index) is int and type(complecount_trace) is int
+            and 0 <= phase_entropy_index <= 31 and 0 <= complecount_trace <= 7):
+        score, score_x100 = _RA_SCORE_TABLE[(phase_entropy_index << 3)
+                                            | complecount_trace]
+    else:
+        score = _ra_coherence(phase_entropy_index, complecount_trace)
+        score_x100 = int(score * 100)
+    coherence_valid = score >= threshold
+
+    # KHAT scalar trigger and emergency token freeze
+    state = _khat_etf_step(khat_enable, score_x100, khat_threshold, etf_trigger, state)
+
+    # Arbitration
+    decision = _ROUTE_TABLE[(consent_state << 3) | ((1 if pma_hit else 0) << 2)
+                            | ((1 if needs_fallback else 0) << 1) | coherence_valid]
+
+    return decision, state
+
+
+def clock_bulk(enables: List[bool], coherence_scores: List[int],
+               etf_triggers: List[bool], activation_threshold: int,
+               state: Tuple[int, bool, bool, int]
+               ) -> Tuple[array, array, Tuple[int, bool, bool, int]]:
+    """
+    ScalarTrigger_Ra_Khat.clock() and ETFController.clock() over a window
+    of cycles.
+
+    Both state machines step together in one loop, their registers passed
+    in and out as a pipeline_decide() state tuple. Returns the per-cycle
+    scalar_triggered and etf_active columns and the state after the last
+    cycle.
+    """
+    step = _khat_etf_step
+    triggered = bytearray(len(coherence_scores))
+    frozen = bytearray(len(coherence_scores))
 
+    for i, (enable, score, etf_trigger) in enumerate(
+            zip(enables, coherence_scores, etf_triggers)):
+        state = step(enable, score, activation_threshold, etf_trigger, state)
+        triggered[i] = state[1]
+        frozen[i] = state[2]
 
-@dataclass
+    return array('B', triggered), array('B', frozen), state
+
+
+@dataclass(**_SLOTS)
 class PhaseMemoryAnchorRAM:
-    """Behavioral model of PMA RAM."""
+    """
+    Behavioral model of PMA RAM.
+
+    Entries are kept as one int per address: CPython reads and writes a
+    144-bit int in a list slot without boxing, which beats splitting it
+    into fixed-width words. Out-of-range writes are ignored and reads
+    return 0.
+    """
     depth: int = 256
     memory: List[int] = field(default_factory=list)
 
@@ -508,13 +950,41 @@ class PhaseMemoryAnchorRAM:
 
     def write(self, addr: int, data: int) -> None:
         if 0 <= addr < self.depth:
-            self.memory[addr] = data & ((1 << 144) - 1)
+            self.memory[addr] = data & HEADER_MASK
 
     def read(self, addr: int) -> int:
         if 0 <= addr < self.depth:
             return self.memory[addr]
         return 0
 
+    def write_bytes(self, addr: int, buf: bytes) -> None:
+        """write() of one 18-byte big-endian header record."""
+        if len(buf) != HEADER_STRUCT.size:
+            raise struct.error(f"PMA record must be {HEADER_STRUCT.size} bytes")
+        if 0 <= addr < self.depth:
+            self.memory[addr] = int.from_bytes(buf, "big")
+
+    def read_bytes(self, addr: int) -> bytes:
+        """
+        read() as an 18-byte big-endian header record, ready for
+        ConsentHeaderParser.parse_bytes().
+        """
+        if 0 <= addr < self.depth:
+            return self.memory[addr].to_bytes(18, "big")
+        return bytes(18)
+
+    def write_batch(self, addrs: List[int], datas: List[int]) -> None:
+        """write() each (addr, data) pair in order, in one loop."""
+        memory = self.memory
+        depth = self.depth
+        for addr, data in zip(addrs, datas):
+            if 0 <= addr < depth:
+                memory[addr] = data & HEADER_MASK
+
+    def window_ids(self) -> array:
+        """coherence_window_id (header bits [31:16]) of every entry."""
+        return array('H', [(entry >> 16) & 0xFFFF for entry in self.memory])
+
 
 # =============================================================================
 # Testbench
@@ -678,6 +1148,61 @@ class SpiralRaTestbench:
 
         return results
 
+    def run_coherence_batch_tests(self):
+        """Check evaluate_batch() columns against per-sample evaluate()."""
+        self._trace("="*60)
+        self._trace("CoherenceEvaluator_Ra - Batch Evaluation")
+        self._trace("="*60)
+
+        in_range = [(e, c) for e in range(32) for c in range(8)]
+        out_of_range = [(32, 0), (40, 7), (31, 8), (0, 12), (-1, 3), (15.5, 3), (20, 2.5)]
+
+        for desc, samples in (("in-range", in_range),
+                              ("out-of-range", in_range[:8] + out_of_range)):
+            entropies = [e for e, _ in samples]
+            comples = [c for _, c in samples]
+            batch = CoherenceEvaluator_Ra()
+            columns = batch.evaluate_batch(entropies, comples, 4.0)
+
+            mismatches = 0
+            reference = CoherenceEvaluator_Ra()
+            for i, (e, c) in enumerate(samples):
+                reference.evaluate(e, c, 4.0)
+                for name, column in columns.items():
+                    if column[i] != getattr(reference, name):
+                        mismatches += 1
+
+            self._trace(f"{desc}: {len(samples)} samples")
+            self._check(f"evaluate_batch matches evaluate ({desc})", mismatches == 0)
+            self._check(f"evaluate_batch leaves the last sample ({desc})", batch == reference)
+
+        empty = CoherenceEvaluator_Ra().evaluate_batch([], [], 4.0)
+        self._check("evaluate_batch of no samples gives empty columns",
+                    not any(empty.values()))
+
+        # Mismatched columns are refused rather than truncated, including an
+        # empty complecount column
+        for desc, entropies, comples in (("short complecount", [1, 2, 3], [1, 2]),
+                                         ("empty complecount", [1, 2, 3], [])):
+            try:
+                CoherenceEvaluator_Ra().evaluate_batch(entropies, comples, 4.0)
+                refused = False
+            except ValueError:
+                refused = True
+            self._check(f"evaluate_batch refuses mismatched lengths ({desc})", refused)
+
+        # An input max() cannot compare fails as evaluate() does, from the formula
+        errors = []
+        for call in (lambda: CoherenceEvaluator_Ra().evaluate_batch([1, 2], [3, None], 4.0),
+                     lambda: CoherenceEvaluator_Ra().evaluate(2, None, 4.0)):
+            try:
+                call()
+                errors.append(None)
+            except TypeError as exc:
+                errors.append(str(exc))
+        self._check("evaluate_batch raises evaluate()'s error on non-comparable input",
+                    errors[0] is not None and errors[0] == errors[1])
+
     def run_scalar_trigger_tests(self):
         """Test scalar trigger with various durations."""
         self._trace("="*60)
@@ -695,7 +1220,7 @@ class SpiralRaTestbench:
         print("------|---------|-------|-----------|-------")
 
         for cycle in range(10):
-            self.coherence.evaluate(15, 3, 3.0)  # Medium coherence
+            self.coherence.evaluate(15, 3, 3.0, int_only=True)  # Medium coherence
             self.scalar.clock(
                 enable=True,
                 radius=150,
@@ -890,6 +1415,169 @@ class SpiralRaTestbench:
         self._check("Has PMA link", self.parser.has_pma_link)
         self._check("Full consent (high somatic)", self.parser.consent_state == ConsentState.FULL_CONSENT)
 
+    @staticmethod
+    def _stream_headers() -> List[int]:
+        """256 headers in which every byte position takes all 256 values."""
+        return [int.from_bytes(bytes((i * (2 * j + 1) + j * 29) & 0xFF
+                                     for j in range(HEADER_STRUCT.size)), "big")
+                for i in range(256)]
+
+    def run_header_batch_tests(self):
+        """Check parse_batch() columns against per-header parse()."""
+        self._trace("="*60)
+        self._trace("ConsentHeaderParser - Batch Parse")
+        self._trace("="*60)
+
+        headers = self._stream_headers()
+        buf = b"".join(header.to_bytes(HEADER_STRUCT.size, "big") for header in headers)
+        batch_parser = ConsentHeaderParser()
+        columns = batch_parser.parse_batch(buf)
+
+        mismatches = 0
+        reference = ConsentHeaderParser()
+        for i, header in enumerate(headers):
+            reference.parse(header)
+            for name, column in columns.items():
+                if column[i] != int(getattr(reference, name)):
+                    mismatches += 1
+
+        self._trace(f"Compared {len(columns)} columns over {len(headers)} headers")
+        self._check("parse_batch columns match parse()", mismatches == 0)
+        self._check("parse_batch leaves the last header parsed", batch_parser == reference)
+
+        empty = ConsentHeaderParser().parse_batch(b"")
+        self._check("parse_batch of an empty buffer gives empty columns",
+                    empty.keys() == columns.keys() and not any(empty.values()))
+
+        try:
+            ConsentHeaderParser().parse_batch(buf[:-1])
+            rejected = False
+        except struct.error:
+            rejected = True
+        self._check("parse_batch rejects a partial header", rejected)
+
+    def run_header_record_tests(self):
+        """Check HeaderRecord fields and from_record() against parse_bytes()."""
+        self._trace("="*60)
+        self._trace("HeaderRecord - ctypes View vs parse_bytes")
+        self._trace("="*60)
+
+        size = HEADER_STRUCT.size
+        stream = b"".join(header.to_bytes(size, "big") for header in self._stream_headers())
+        records = header_records(stream)
+        names = [name for name, *_ in HeaderRecord._fields_ if hasattr(self.parser, name)]
+
+        field_errors = 0
+        parser_errors = 0
+        reference = ConsentHeaderParser()
+        for i, record in enumerate(records):
+            reference.parse_bytes(stream, i * size)
+            for name in names:
+                if getattr(record, name) != int(getattr(reference, name)):
+                    field_errors += 1
+            if ConsentHeaderParser.from_record(record) != reference:
+                parser_errors += 1
+
+        self._trace(f"Compared {len(names)} fields over {len(records)} records")
+        self._check("HeaderRecord size is 18 bytes", ctypes.sizeof(HeaderRecord) == size)
+        self._check("header_records covers every header", len(records) == len(stream) // size)
+        self._check("HeaderRecord fields match parse_bytes", field_errors == 0)
+        self._check("from_record matches parse_bytes", parser_errors == 0)
+
+        # A writable buffer is viewed in place rather than copied
+        shared = bytearray(stream[:size])
+        view = header_records(shared)
+        shared[11] = (17 << 3) | 6
+        self._check("header_records shares a writable buffer",
+                    (view[0].phase_entropy_index, view[0].complecount_trace) == (17, 6))
+
+    def run_header_crc_tests(self):
+        """Check compute_header_crc() and verify_crc_batch()."""
+        self._trace("="*60)
+        self._trace("Header CRC-8 - Scalar and Batch Checks")
+        self._trace("="*60)
+
+        # CRC-8/CCITT catalogue check value
+        self._check("CRC-8 of '123456789' is 0xF4",
+                    compute_header_crc(b"123456789") == 0xF4)
+
+        rpp_addr = (12 << 27) | (3 << 24) | (2 << 21) | (128 << 13)
+        body = (rpp_addr.to_bytes(4, "big") + (0xDEADBEEF).to_bytes(4, "big")
+                + bytes([0x12, 0x34, 0xE5, 0xA5, 0x03, 0xAA, 0x1A, 0x2B, 0x55]))
+        crc = compute_header_crc(body)
+        good = body + bytes([crc])
+        bad = body + bytes([crc ^ 0x01])
+        self._trace(f"Header CRC: 0x{crc:02X}")
+
+        flags = verify_crc_batch(good + bad)
+        self._check("Header with correct CRC verifies", flags[0] == 1)
+        self._check("Header with bad CRC is rejected", flags[1] == 0)
+
+        # Stream headers carry arbitrary CRC bytes; every other one is
+        # resealed with its computed CRC
+        size = HEADER_STRUCT.size
+        stream = bytearray()
+        for i, header in enumerate(self._stream_headers()):
+            raw = header.to_bytes(size, "big")
+            if i % 2 == 0:
+                raw = raw[:17] + bytes([compute_header_crc(raw)])
+            stream += raw
+        expected = [int(compute_header_crc(stream, offset) == stream[offset + 17])
+                    for offset in range(0, len(stream), size)]
+        self._trace(f"Stream: {sum(expected)} of {len(expected)} headers carry a valid CRC")
+        self._check("verify_crc_batch matches compute_header_crc",
+                    list(verify_crc_batch(stream)) == expected)
+
+    def run_pma_tests(self):
+        """Test PMA RAM word, batch and record access."""
+        self._trace("="*60)
+        self._trace("PhaseMemoryAnchorRAM - Read/Write")
+        self._trace("="*60)
+
+        ram = self.pma_ram
+        depth = ram.depth
+        headers = self._stream_headers()
+
+        # Word access: 144-bit mask, out-of-range writes ignored
+        ram.write(0, headers[0])
+        ram.write(1, (1 << 150) | headers[1])
+        ram.write(depth, headers[2])
+        self._check("PMA write/read", ram.read(0) == headers[0])
+        self._check("PMA write masks to 144 bits", ram.read(1) == headers[1])
+        self._check("PMA out-of-range read returns 0", ram.read(depth) == 0 and ram.read(-1) == 0)
+
+        # Batch load: in order, out-of-range addresses skipped
+        addrs = list(range(depth)) + [depth, -1, 5]
+        datas = headers[:depth] + [headers[1], headers[2], headers[7]]
+        ram.write_batch(addrs, datas)
+        expected = headers[:depth]
+        expected[5] = headers[7]
+        self._check("PMA write_batch matches per-address writes",
+                    [ram.read(addr) for addr in range(depth)] == expected)
+        self._check("PMA window_ids matches entries",
+                    list(ram.window_ids()) == [(entry >> 16) & 0xFFFF for entry in expected])
+
+        # 18-byte records
+        size = HEADER_STRUCT.size
+        record = headers[9].to_bytes(size, "big")
+        ram.write_bytes(3, record)
+        self._check("PMA write_bytes/read word", ram.read(3) == headers[9])
+        self._check("PMA read_bytes round trip", ram.read_bytes(3) == record)
+        self._check("PMA out-of-range read_bytes returns zeros", ram.read_bytes(depth) == bytes(size))
+
+        from_bytes = ConsentHeaderParser()
+        from_bytes.parse_bytes(ram.read_bytes(3))
+        from_word = ConsentHeaderParser()
+        from_word.parse(ram.read(3))
+        self._check("PMA read_bytes parses like read", from_bytes == from_word)
+
+        try:
+            ram.write_bytes(4, record[:-1])
+            rejected = False
+        except struct.error:
+            rejected = True
+        self._check("PMA write_bytes rejects a short record", rejected and ram.read(4) == expected[4])
+
     def run_integration_tests(self):
         """Full pipeline integration scenarios."""
         self._trace("="*60)
@@ -960,6 +1648,110 @@ class SpiralRaTestbench:
         self._trace(f"  Use PMA route: {self.arbitrator.use_pma_route}")
         self._check("Scenario 3: PMA route used", self.arbitrator.use_pma_route)
 
+    def run_pipeline_tests(self):
+        """Check pipeline_decide() against the chained models."""
+        self._trace("="*60)
+        self._trace("pipeline_decide - Fused Path vs Chained Models")
+        self._trace("="*60)
+
+        coherence = CoherenceEvaluator_Ra()
+        khat = ScalarTrigger_Ra_Khat()
+        etf = ETFController()
+        arbitrator = ConsentArbitrator_Ra()
+        state = PIPELINE_RESET_STATE
+        consent_states = list(ConsentState)
+
+        # Blocks of 1-16 cycles holding one input, so the KHAT counter
+        # saturates and the ETF hold expires. Entropy and complecount run
+        # past their field ranges; pma_hit cycles through 0, 1 and 2.
+        cycles = 0
+        decision_errors = 0
+        state_errors = 0
+        for block in range(256):
+            entropy = (block * 7) % 36
+            comple = (block * 3) % 10
+            threshold = (1.0, 3.0, 4.0, 5.5, 6.5)[block % 5]
+            khat_enable = block % 7 != 0
+            khat_threshold = 150 + (block * 37) % 500
+            for i in range(block % 16 + 1):
+                etf_trigger = i == 0 and block % 8 == 0
+                consent_state = consent_states[(cycles // 3) % 4]
+                needs_fallback = cycles % 2 == 1
+                pma_hit = cycles % 3
+
+                coherence.evaluate(entropy, comple, threshold)
+                khat.clock(khat_enable, coherence.coherence_score_x100, khat_threshold)
+                etf.clock(etf_trigger, coherence.coherence_score_x100)
+                arbitrator.arbitrate(coherence.coherence_valid, khat.scalar_triggered,
+                                     consent_state, needs_fallback, pma_hit)
+
+                decision, state = pipeline_decide(
+                    entropy, comple, threshold, khat_enable, khat_threshold,
+                    etf_trigger, consent_state, needs_fallback, pma_hit, state)
+
+                if decision != arbitrator.routing_decision:
+                    decision_errors += 1
+                if state != (khat.coherence_counter, khat.scalar_triggered,
+                             etf.etf_active, etf.etf_counter):
+                    state_errors += 1
+                cycles += 1
+
+        self._trace(f"Compared {cycles} cycles")
+        self._check("pipeline_decide routing matches chained models", decision_errors == 0)
+        self._check("pipeline_decide KHAT/ETF state matches chained models", state_errors == 0)
+
+    def run_clock_bulk_tests(self):
+        """Check clock_bulk() against per-cycle KHAT/ETF clocking."""
+        self._trace("="*60)
+        self._trace("clock_bulk - Bulk KHAT/ETF vs Per-Cycle Clocking")
+        self._trace("="*60)
+
+        # Scores held for 1-20 cycles around the KHAT threshold (300) and
+        # the ETF release threshold (559)
+        enables = []
+        scores = []
+        etf_triggers = []
+        for block in range(96):
+            score = (120, 320, 560, 650, 299, 558)[block % 6]
+            for i in range((block * 7) % 20 + 1):
+                enables.append(block % 11 != 5)
+                scores.append(score)
+                etf_triggers.append(i == 0 and block % 9 == 0)
+
+        khat = ScalarTrigger_Ra_Khat()
+        etf = ETFController()
+        expected_triggered = []
+        expected_frozen = []
+        for enable, score, etf_trigger in zip(enables, scores, etf_triggers):
+            khat.clock(enable, score, 300)
+            etf.clock(etf_trigger, score)
+            expected_triggered.append(khat.scalar_triggered)
+            expected_frozen.append(etf.etf_active)
+
+        # Two windows, the second resuming from the first one's state
+        split = len(scores) // 3
+        triggered, frozen, state = clock_bulk(
+            enables[:split], scores[:split], etf_triggers[:split], 300,
+            PIPELINE_RESET_STATE)
+        more_triggered, more_frozen, state = clock_bulk(
+            enables[split:], scores[split:], etf_triggers[split:], 300, state)
+        triggered += more_triggered
+        frozen += more_frozen
+
+        self._trace(f"Compared {len(scores)} cycles "
+                   f"({sum(expected_triggered)} triggered, {sum(expected_frozen)} frozen)")
+        self._check("clock_bulk scalar_triggered matches ScalarTrigger_Ra_Khat",
+                    list(triggered) == expected_triggered)
+        self._check("clock_bulk etf_active matches ETFController",
+                    list(frozen) == expected_frozen)
+        self._check("clock_bulk final state matches models",
+                    state == (khat.coherence_counter, khat.scalar_triggered,
+                              etf.etf_active, etf.etf_counter))
+
+        empty_triggered, empty_frozen, empty_state = clock_bulk([], [], [], 300, state)
+        self._check("clock_bulk empty window keeps state",
+                    not empty_triggered and not empty_frozen and empty_state == state)
+
     def run_all_tests(self):
         """Execute complete test suite."""
         self.vcd.begin()
@@ -969,11 +1761,18 @@ class SpiralRaTestbench:
 
         try:
             self.run_coherence_sweep()
+            self.run_coherence_batch_tests()
             self.run_scalar_trigger_tests()
             self.run_fallback_tests()
             self.run_arbitrator_tests()
             self.run_header_parser_tests()
+            self.run_header_batch_tests()
+            self.run_header_record_tests()
+            self.run_header_crc_tests()
+            self.run_pma_tests()
             self.run_integration_tests()
+            self.run_pipeline_tests()
+            self.run_clock_bulk_tests()
         finally:
             self.vcd.end()
 